@@ -30,6 +30,24 @@ from nhmesh_producer.utils.node_cache import NodeCache
 from nhmesh_producer.utils.traceroute_manager import TracerouteManager
 from nhmesh_producer.web_interface import WebInterface
 
+# pubsub topics that trigger immediate reconnection
+DISCONNECT_TOPICS = (
+    "meshtastic.disconnect",
+    "meshtastic.connection.lost",
+    "meshtastic.connection.failed",
+    "meshtastic.error",
+    "meshtastic.connection.error",
+    "meshtastic.interface.error",
+    "meshtastic.reader.error",
+    "meshtastic.stream.error",
+)
+
+# pubsub topics that signal a connection success
+CONNECT_TOPICS = (
+    "meshtastic.connection.established",
+    "meshtastic.connected",
+)
+
 logging.basicConfig(
     level=environ.get("LOG_LEVEL", "INFO").upper(),
     format="%(asctime)s - %(levelname)s - %(message)s",
@@ -114,7 +132,10 @@ class MeshtasticMQTTHandler:
         else:
             raise ValueError("connection_type must be 'tcp' or 'serial'")
 
-        # Get interface and check if it's available
+        # Connect up front; get_interface() only schedules reconnects in the
+        # background, so it cannot establish the first connection
+        if not self.connection_manager.reconnect():
+            raise Exception("Failed to get Meshtastic interface")
         interface = self.connection_manager.get_interface()
         if interface is None:
             raise Exception("Failed to get Meshtastic interface")
@@ -150,11 +171,12 @@ class MeshtasticMQTTHandler:
         self.mqtt_client.on_disconnect = self._on_mqtt_disconnect
         self.mqtt_client.on_publish = self._on_mqtt_publish
         self.mqtt_client.on_message = self._on_mqtt_message
+        # Exponential backoff between automatic reconnects, max 60s
+        self.mqtt_client.reconnect_delay_set(min_delay=5, max_delay=60)
 
         # MQTT connection state
         self.mqtt_connected = False
         self.mqtt_reconnect_attempts = 0
-        self.max_mqtt_reconnect_attempts = 5
         self._shutdown_event = threading.Event()  # Thread-safe shutdown signal
         
         # Packet ID generation (Meshtastic-like 32-bit counter seeded randomly)
@@ -191,22 +213,15 @@ class MeshtasticMQTTHandler:
             traceroute_persistence_file,
         )
 
-        # Subscribe to packet events AFTER traceroute_manager is initialized
-        pub.subscribe(self.onReceive, "meshtastic.receive")  # type: ignore
-
-        # Subscribe to disconnect events for immediate reconnection
-        pub.subscribe(self.onDisconnect, "meshtastic.disconnect")  # type: ignore
-        pub.subscribe(self.onDisconnect, "meshtastic.connection.lost")  # type: ignore
-        pub.subscribe(self.onDisconnect, "meshtastic.connection.failed")  # type: ignore
-        pub.subscribe(self.onDisconnect, "meshtastic.error")  # type: ignore
-        pub.subscribe(self.onDisconnect, "meshtastic.connection.error")  # type: ignore
-        pub.subscribe(self.onDisconnect, "meshtastic.interface.error")  # type: ignore
-        pub.subscribe(self.onDisconnect, "meshtastic.reader.error")  # type: ignore
-        pub.subscribe(self.onDisconnect, "meshtastic.stream.error")  # type: ignore
-
-        # Subscribe to connection success events
-        pub.subscribe(self.onConnect, "meshtastic.connection.established")  # type: ignore
-        pub.subscribe(self.onConnect, "meshtastic.connected")  # type: ignore
+        # Subscribe to packet, disconnect and connect events AFTER
+        # traceroute_manager is initialized; cleanup() undoes these
+        self._subscriptions: list[tuple[Any, str]] = [
+            (self.onReceive, "meshtastic.receive"),
+            *((self.onDisconnect, topic) for topic in DISCONNECT_TOPICS),
+            *((self.onConnect, topic) for topic in CONNECT_TOPICS),
+        ]
+        for listener, topic in self._subscriptions:
+            pub.subscribe(listener, topic)  # type: ignore
 
         # Initialize web interface if enabled
         if self.web_interface_enabled:
@@ -293,33 +308,21 @@ class MeshtasticMQTTHandler:
         """Callback for MQTT disconnection with automatic reconnection"""
         self.mqtt_connected = False
         if rc != 0:
-            # Unexpected disconnect
-            logging.warning(f"Unexpected disconnect from MQTT broker (code: {rc}), will auto-reconnect")
+            # Unexpected disconnect. The network loop started by loop_start()
+            # reconnects on its own, backing off per reconnect_delay_set()
             self.mqtt_reconnect_attempts += 1
-            
-            if self.mqtt_reconnect_attempts <= self.max_mqtt_reconnect_attempts:
-                # Schedule reconnection in background
-                def reconnect_mqtt():
-                    delay = min(5 * (2 ** (self.mqtt_reconnect_attempts - 1)), 60)  # Exponential backoff, max 60s
-                    logging.info(f"Attempting MQTT reconnection in {delay}s (attempt {self.mqtt_reconnect_attempts}/{self.max_mqtt_reconnect_attempts})")
-                    time.sleep(delay)
-                    if not self._shutdown_event.is_set():
-                        try:
-                            client.reconnect()
-                            logging.info("MQTT reconnection successful")
-                        except Exception as e:
-                            logging.error(f"MQTT reconnection failed: {e}")
-                
-                threading.Thread(target=reconnect_mqtt, daemon=True).start()
-            else:
-                logging.error(f"Max MQTT reconnection attempts ({self.max_mqtt_reconnect_attempts}) reached")
+            logging.warning(
+                "Unexpected disconnect from MQTT broker (code: %s), will auto-reconnect (attempt %s)",
+                rc,
+                self.mqtt_reconnect_attempts,
+            )
         else:
             # Clean disconnect
             logging.info("Cleanly disconnected from MQTT broker")
 
     def _on_mqtt_publish(self, client: Any, userdata: Any, mid: int) -> None:
         """Callback for MQTT publish"""
-        logging.debug(f"Message published: {mid}")
+        logging.debug("Message published: %s", mid)
 
     def _on_mqtt_message(self, client: Any, userdata: Any, msg: Any) -> None:
         """Callback for MQTT message reception"""
@@ -399,7 +402,7 @@ class MeshtasticMQTTHandler:
 
         key = (text, to_id)
         with self._pending_lock:
-            self._pending_sent[key] = time.time()
+            self._pending_sent[key] = time.monotonic()
 
         # Start a one-shot timer to publish fallback echo if not matched in time
         def _fallback_publish() -> None:
@@ -408,7 +411,7 @@ class MeshtasticMQTTHandler:
                     ts = self._pending_sent.get(key)
                     if ts is None:
                         return  # already matched and published
-                    if (time.time() - ts) < self._pending_timeout_sec:
+                    if (time.monotonic() - ts) < self._pending_timeout_sec:
                         return  # another timer likely exists; avoid early publish
                     # Not matched in time; remove and publish fallback
                     self._pending_sent.pop(key, None)
@@ -546,6 +549,14 @@ class MeshtasticMQTTHandler:
         # Stop the main loop first
         self._shutdown_event.set()  # Signal shutdown to main thread
 
+        # Stop receiving meshtastic events so a retired handler isn't still
+        # invoked for every packet alongside its replacement
+        for listener, topic in getattr(self, "_subscriptions", []):
+            try:
+                pub.unsubscribe(listener, topic)  # type: ignore
+            except Exception as e:
+                logging.debug(f"[Cleanup] Could not unsubscribe from {topic}: {e}")
+
         # Cleanup TracerouteManager and save state first
         if hasattr(self, "traceroute_manager"):
             try:
@@ -677,7 +688,7 @@ class MeshtasticMQTTHandler:
         logging.info(
             f"[onReceive] Packet received from '{packet_dict.get('fromId', 'unknown')}' to '{packet_dict.get('to', 'unknown')}'"
         )
-        logging.debug(f"[onReceive] Raw packet: {packet_dict}")
+        logging.debug("[onReceive] Raw packet: %s", packet_dict)
 
         # Notify connection manager that a packet was received
         self.connection_manager.packet_received()
@@ -688,7 +699,7 @@ class MeshtasticMQTTHandler:
         try:
             self._try_match_and_publish_echo_from_rf(packet_dict)
         except Exception as e:
-            logging.debug(f"Self-RF correlation check failed: {e}")
+            logging.debug("Self-RF correlation check failed: %s", e)
 
         out_packet: dict[str, Any] = {}
         for field_descriptor, field_value in packet_dict.items():
@@ -733,9 +744,9 @@ class MeshtasticMQTTHandler:
                  
              if channel_idx in self.channel_map:
                  out_packet["channelName"] = self.channel_map[channel_idx]
-                 logging.debug(f"Injected channelName '{out_packet['channelName']}' for index {channel_idx}")
+                 logging.debug("Injected channelName '%s' for index %s", out_packet["channelName"], channel_idx)
              else:
-                 logging.debug(f"No name found for channel index {channel_idx}")
+                 logging.debug("No name found for channel index %s", channel_idx)
 
         self.publish_dict_to_mqtt(out_packet)
 
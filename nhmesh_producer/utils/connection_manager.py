@@ -3,14 +3,202 @@ ConnectionManager for managing Meshtastic interface connections with automatic r
 """
 
 import logging
+import os
+import queue
+import random
+import re
+import socket
 import threading
 import time
-from typing import Any
+from collections.abc import Callable
+from concurrent.futures import Future
+from typing import Any, Self
 
 import meshtastic
 import meshtastic.serial_interface
 import meshtastic.tcp_interface
 
+logger = logging.getLogger(__name__)
+
+# Kernel-level dead-peer detection for the TCPInterface socket: keepalive probes
+# after 5s idle, every 2s, 3 misses, and abort if sent data stays unacknowledged
+# for 15s. Options missing on this platform are skipped.
+_TCP_SOCKET_OPTIONS: tuple[tuple[int, str, int], ...] = (
+    (socket.SOL_SOCKET, "SO_KEEPALIVE", 1),
+    (socket.IPPROTO_TCP, "TCP_KEEPIDLE", 5),
+    (socket.IPPROTO_TCP, "TCP_KEEPINTVL", 2),
+    (socket.IPPROTO_TCP, "TCP_KEEPCNT", 3),
+    (socket.IPPROTO_TCP, "TCP_USER_TIMEOUT", 15000),
+)
+
+# How long connect() waits on the quick probe of an interface it may reuse
+_REUSE_PROBE_TIMEOUT = 1.0
+
+# Upper bound on waiting for the node to finish streaming its config
+_CONFIG_COMPLETE_TIMEOUT = 120.0
+
+# The health monitor runs the getMyNodeInfo() step on every Nth check only
+_DEEP_CHECK_EVERY = 6
+
+# Reconnect failures are logged at WARNING once per this many attempts
+_RETRY_WARN_EVERY = 10
+
+# How long connect() waits for the old interface to close before dialling again
+_CLOSE_TIMEOUT = 5.0
+
+# Failures that most likely originate on the remote side; these count against
+# connection_errors less aggressively. Connect errors also cover serial/timeouts.
+_CONN_ERR_RE = re.compile(
+    r"broken pipe|connection reset|connection refused|serial|timeout", re.IGNORECASE
+)
+_LINK_ERR_RE = re.compile(
+    r"broken pipe|connection reset|connection refused", re.IGNORECASE
+)
+
+
+class _HealthCheckResult:
+    """Outcome of a single health check, filled in by the probe thread"""
+
+    __slots__ = ("success", "exception")
+
+    def __init__(self) -> None:
+        self.success: bool = False
+        self.exception: Exception | None = None
+
+
+class _DaemonWorker:
+    """
+    One daemon thread that runs submitted calls in order.
+
+    ThreadPoolExecutor workers are joined at interpreter exit, so a call stuck
+    inside meshtastic would keep the process from exiting; this thread is not.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._jobs: queue.SimpleQueue[
+            tuple[Future[Any], Callable[..., Any], tuple[Any, ...]] | None
+        ] = queue.SimpleQueue()
+        self._shutdown = False
+        threading.Thread(target=self._run, name=name, daemon=True).start()
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future[Any]:
+        if self._shutdown:
+            raise RuntimeError("cannot submit after shutdown")
+        future: Future[Any] = Future()
+        self._jobs.put((future, fn, args))
+        return future
+
+    def shutdown(self) -> None:
+        """Let the thread exit once it has run the calls already queued"""
+        self._shutdown = True
+        self._jobs.put(None)
+
+    def _run(self) -> None:
+        while (job := self._jobs.get()) is not None:
+            future, fn, args = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+
+def _configure_tcp_socket(sock: socket.socket) -> None:
+    """Enable TCP keepalive and TCP_USER_TIMEOUT on a dialled socket"""
+    for level, name, value in _TCP_SOCKET_OPTIONS:
+        option = getattr(socket, name, None)
+        if option is None:
+            continue
+        try:
+            sock.setsockopt(level, option, value)
+        except OSError as e:
+            logger.debug("Could not set %s on socket: %s", name, e)
+
+
+class _TCPInterface(meshtastic.tcp_interface.TCPInterface):
+    """
+    TCPInterface whose every dial is bounded by a connect timeout.
+
+    meshtastic dials with socket.create_connection() and no timeout, so an
+    unreachable node blocks for the OS SYN timeout (minutes). Overriding
+    myConnect() also covers the redials meshtastic makes on its own after a
+    dropped link, which then get _TCP_SOCKET_OPTIONS too.
+    """
+
+    def __init__(self, hostname: str, connect_timeout: float, **kwargs: Any) -> None:
+        # Set before the base constructor, which dials when connectNow is set
+        self.connect_timeout = connect_timeout
+        super().__init__(hostname=hostname, **kwargs)
+
+    def myConnect(self) -> None:
+        sock = socket.create_connection(
+            (self.hostname, self.portNumber), timeout=self.connect_timeout
+        )
+        sock.settimeout(None)  # meshtastic's reader expects a blocking socket
+        _configure_tcp_socket(sock)
+        self.socket = sock
+
+
+def _check_socket(sock: socket.socket) -> None:
+    """Raise if the kernel reports a pending error or the peer has closed the socket"""
+    err = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+    if err != 0:
+        raise ConnectionError(f"Socket error detected: {os.strerror(err)}")
+
+    # Peek for EOF without consuming data. MSG_DONTWAIT makes only this call
+    # non-blocking, leaving the socket mode alone for meshtastic's reader thread.
+    dontwait = getattr(socket, "MSG_DONTWAIT", None)
+    if dontwait is None:
+        return
+    try:
+        if sock.recv(1, socket.MSG_PEEK | dontwait) == b"":
+            raise ConnectionResetError("peer closed the connection")
+    except BlockingIOError:
+        pass  # No data pending, connection still open
+
+
+def _do_health_check(
+    interface: Any, result: _HealthCheckResult, deep: bool = True
+) -> None:
+    """
+    Probe the interface, recording the outcome.
+
+    The socket and meshtastic's isConnected flag are always checked; the
+    getMyNodeInfo() step only runs when deep is set or there is no socket.
+    """
+    try:
+        # meshtastic clears isConnected as soon as its reader sees the link drop
+        is_connected = getattr(interface, "isConnected", None)
+        if isinstance(is_connected, threading.Event) and not is_connected.is_set():
+            raise Exception("Interface reports it is not connected")
+
+        # Check the socket first so a kernel-detected failure short-circuits
+        # the slower getMyNodeInfo() round-trip
+        sock = getattr(interface, "socket", None)
+        if sock:
+            try:
+                _check_socket(sock)
+                logger.debug("Socket health check passed")
+            except Exception as socket_e:
+                logger.warning("Socket health check failed: %s", socket_e)
+                raise Exception(f"Socket connection broken: {socket_e}") from socket_e
+            if not deep:
+                result.success = True
+                return
+
+        logger.debug("Health check: calling getMyNodeInfo()...")
+        node_info = interface.getMyNodeInfo()
+        logger.debug("Health check: getMyNodeInfo() returned: %s", node_info)
+        if node_info is None:
+            raise Exception("getMyNodeInfo returned None")
+
+        result.success = True
+        logger.debug("Health check: getMyNodeInfo() succeeded")
+    except Exception as e:
+        logger.error("Health check: probe failed with exception: %s", e)
+        result.exception = e
+
 
 class ConnectionManager:
     """Manages connection health and automatic reconnection for Meshtastic interface"""
@@ -22,35 +210,79 @@ class ConnectionManager:
         connection_type: str = "tcp",  # "tcp" or "serial"
         reconnect_attempts: int = 5,
         reconnect_delay: int = 5,
+        reconnect_delay_max: int = 60,  # Upper bound on a single backoff wait
+        reconnect_jitter: bool = True,  # Randomise waits to desynchronise retriers
         health_check_interval: int = 10,  # Back to 10 seconds since events handle immediate detection
         packet_timeout: int = 60,  # Reconnect if no packets received for 60 seconds
+        connect_timeout: int = 10,  # TCP connect timeout for the node
     ) -> None:
         self.node_ip = node_ip
         self.serial_port = serial_port
         self.connection_type = connection_type.lower()
-        self.reconnect_attempts = reconnect_attempts
+        self.reconnect_attempts = reconnect_attempts  # Negative retries forever
+        self._retries_since_last_success = 0
         self.reconnect_delay = reconnect_delay
+        self.reconnect_delay_max = reconnect_delay_max
+        self.reconnect_jitter = reconnect_jitter
         self.health_check_interval = health_check_interval
+        # The monitor backs off on a stable link, never beyond packet_timeout
+        # so silence is still noticed within one timeout
+        self._current_interval: float = health_check_interval
+        self._max_health_check_interval = max(
+            health_check_interval, min(300, packet_timeout)
+        )
         self.packet_timeout = packet_timeout
+        self.connect_timeout = connect_timeout
         self.interface: Any = None
-        self.connected = False
-        self.last_heartbeat = time.time()
-        self.last_packet_time = time.time()  # Track when last packet was received
+        # Backs the `connected` property so readers never need self.lock
+        self._connected_event = threading.Event()
+        # Cached result of is_connected(), recomputed by the `connected` setter.
+        # Every site that clears self.interface also clears `connected`, and
+        # _mark_connected() assigns the interface before setting it.
+        self._is_connected_cached = False
+        # Short-lived snapshots of get_connection_info()/get_health_status(),
+        # keyed by name and stored as (expiry, dict), so status polling
+        # neither contends for self.lock nor repeats socket syscalls
+        self._status_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+        self._status_ttl = 1.0
+        # All interval timestamps use time.monotonic() so NTP steps or other
+        # wall-clock jumps cannot trigger (or suppress) reconnections.
+        now = time.monotonic()
+        self.last_heartbeat = now
+        self.last_packet_time = now  # Track when last packet was received
         self.connection_errors = 0
         self.max_connection_errors = 10
-        self.lock = threading.RLock()  # Use RLock to allow reentrant locking
+        # Guards connection state only; it is never held across I/O or
+        # re-entered, so a plain Lock suffices
+        self.lock = threading.Lock()
         self.stop_event = threading.Event()
-        self.node_info: dict[str, Any] | None = None
+        # Set by the first close(); later calls (signal handler plus exit
+        # path, or __exit__ after an explicit close) return at once
+        self._closed = False
         self.connected_node_id: str | None = None
-        self.last_successful_health_check = time.time()
+        self.last_successful_health_check = now
+        # A packet received within this many seconds proves the link is alive,
+        # so the health monitor skips its socket and getMyNodeInfo() probes
+        self._probe_ttl = max(health_check_interval, packet_timeout / 2)
+        self._health_check_count = 0
+        # Connection state last reported at INFO by the health monitor
+        self._last_logged_connected: bool | None = None
+        # External errors closer together than this are coalesced
+        self.external_error_debounce = 0.25
+        self._last_external_error_time = float("-inf")
+        # Set by force_reconnect() so the next connect() never reuses the interface
+        self._force_rebuild = False
         self.reconnecting = False  # Flag to prevent multiple simultaneous reconnections
+        # Outcome of the reconnect loop in flight, shared by every caller that
+        # arrives while it runs
+        self._reconnect_future: Future[bool] | None = None
         self.health_check_in_progress = (
             False  # Flag to prevent overlapping health checks
         )
         self.connection_in_progress = (
             False  # Flag to prevent multiple connection attempts
         )
-        self.last_connection_time = 0  # Track when we last connected
+        self.last_connection_time = 0.0  # Track when we last connected
         self.min_connection_time = 30  # Minimum time between connections (30 seconds)
 
         # Validate connection parameters
@@ -60,493 +292,745 @@ class ConnectionManager:
             raise ValueError("serial_port is required for serial connections")
         elif self.connection_type not in ["tcp", "serial"]:
             raise ValueError("connection_type must be 'tcp' or 'serial'")
+        if health_check_interval <= 0 or packet_timeout <= 0:
+            raise ValueError(
+                "health_check_interval and packet_timeout must be positive"
+            )
+        if not 0 <= reconnect_delay <= reconnect_delay_max:
+            raise ValueError(
+                "reconnect_delay must be between 0 and reconnect_delay_max"
+            )
+        if packet_timeout < health_check_interval:
+            # Silence is only noticed on a health cycle
+            logger.warning(
+                "packet_timeout (%ss) is shorter than health_check_interval (%ss); "
+                "packet timeouts will be detected late",
+                packet_timeout,
+                health_check_interval,
+            )
 
         # Don't start health monitoring until after initial connection
         # It will be started by start_health_monitor() after first connect()
         self.health_thread: threading.Thread | None = None
 
+        # Reconnect requests from any thread are funnelled through this queue
+        # to a single worker, so bursts of errors coalesce into one cycle
+        self._reconnect_q: queue.SimpleQueue[bool] = queue.SimpleQueue()
+        self._reconnect_thread: threading.Thread | None = None
+
+        # interface.close() can block on socket shutdown and meshtastic's
+        # thread joins, so it runs here instead of on the caller's thread
+        self._closer = _DaemonWorker("conn-closer")
+        # (socket, local address) recorded when the TCP socket was dialled
+        self._sockname: tuple[socket.socket, Any] | None = None
+        # Health probes reuse one worker instead of a new thread per cycle
+        self._probe_worker = _DaemonWorker("mesh-probe")
+        self._probe_future: Future[None] | None = None
+
+    @property
+    def connected(self) -> bool:
+        """Whether the interface is believed to be healthy"""
+        return self._connected_event.is_set()
+
+    @connected.setter
+    def connected(self, value: bool) -> None:
+        if value:
+            self._connected_event.set()
+        else:
+            self._connected_event.clear()
+        self._is_connected_cached = value and self.interface is not None
+        # Status snapshots must reflect a state change straight away
+        self._status_cache.clear()
+
+    def _bump_errors(self, limit: int | None = None) -> int:
+        """
+        Increment connection_errors, saturating at the cap.
+
+        The caller must hold self.lock, which guards every write to
+        connection_errors, resets included.
+        """
+        cap = self.max_connection_errors
+        if limit is not None:
+            cap = min(cap, limit)
+        if self.connection_errors < cap:
+            self.connection_errors += 1
+        return self.connection_errors
+
     def packet_received(self) -> None:
         """Call this method when a packet is received to update the last packet time"""
-        with self.lock:
-            self.last_packet_time = time.time()
-            logging.debug(
-                f"Packet received, updated last_packet_time to {self.last_packet_time}"
-            )
+        # Called for every packet. A single attribute store is atomic under the
+        # GIL and readers only compare against it, so no lock is needed here.
+        now = time.monotonic()
+        self.last_packet_time = now
+        logger.debug("Packet received, updated last_packet_time to %s", now)
+
+    @staticmethod
+    def _close_interface(interface: Any) -> None:
+        """Close an interface and its underlying socket, logging any errors"""
+        try:
+            logger.info("Closing existing interface...")
+            # Close the underlying socket first if it exists (for TCP)
+            sock = getattr(interface, "socket", None)
+            if sock:
+                try:
+                    logger.debug("Closing socket: %s", sock)
+                    sock.close()
+                    logger.debug("Underlying socket closed")
+                except Exception as e:
+                    logger.warning("Error closing underlying socket: %s", e)
+
+            # Close the interface
+            interface.close()
+            logger.info("Existing interface closed successfully")
+        except Exception as e:
+            logger.warning("Error closing existing interface: %s", e)
+
+    def _close_interface_async(self, interface: Any) -> Future[None]:
+        """Hand an interface to the closer thread and return its future"""
+        try:
+            return self._closer.submit(self._close_interface, interface)
+        except RuntimeError:
+            # Closer already shut down by close(); close inline instead
+            future: Future[None] = Future()
+            self._close_interface(interface)
+            future.set_result(None)
+            return future
 
     def _close_interface_safely(self) -> None:
         """Safely close the interface with proper error handling"""
-        if self.interface:
-            try:
-                logging.info("Closing existing interface...")
-                # Close the underlying socket first if it exists (for TCP)
-                if hasattr(self.interface, "socket") and self.interface.socket:
-                    try:
-                        logging.debug(f"Closing socket: {self.interface.socket}")
-                        self.interface.socket.close()
-                        logging.debug("Underlying socket closed")
-                    except Exception as e:
-                        logging.warning(f"Error closing underlying socket: {e}")
-
-                # Close the interface
-                self.interface.close()
-                logging.info("Existing interface closed successfully")
-            except Exception as e:
-                logging.warning(f"Error closing existing interface: {e}")
-            finally:
-                self.interface = None
-                self.connected = False
+        if self.interface is None:
+            return
+        if self._check_existing_connections():
+            logger.info("Existing connection found, closing it")
+        with self.lock:
+            interface = self.interface
+            self.interface = None
+            self.connected = False
+        if interface:
+            self._close_interface_async(interface)
 
     def _check_existing_connections(self) -> bool:
         """Check if there are existing connections that should be cleaned up"""
-        if self.interface:
+        interface = self.interface
+        if interface:
             try:
                 # For TCP interfaces, check if the interface has a valid socket
-                if hasattr(self.interface, "socket") and self.interface.socket:
+                sock = getattr(interface, "socket", None)
+                if sock:
                     # Try to get socket info to see if it's still valid
                     try:
-                        socket_info = self.interface.socket.getsockname()
-                        logging.debug(f"Existing socket found: {socket_info}")
+                        socket_info = sock.getsockname()
+                        logger.debug("Existing socket found: %s", socket_info)
                         return True
                     except Exception:
-                        logging.warning(
+                        logger.warning(
                             "Existing socket appears to be invalid, will be cleaned up"
                         )
                         return False
                 else:
                     # For serial interfaces, just check if interface exists
-                    logging.debug("Interface exists, will be cleaned up")
+                    logger.debug("Interface exists, will be cleaned up")
                     return False
             except Exception as e:
-                logging.warning(f"Error checking existing connections: {e}")
+                logger.warning("Error checking existing connections: %s", e)
                 return False
         return False
 
-    def connect(self, skip_lock: bool = False) -> bool:
+    def connect(self) -> bool:
         """Establish connection to Meshtastic node with error handling"""
-        logging.info(f"connect() called with skip_lock={skip_lock}")
+        logger.info("connect() called")
+        # Claim the connection slot and detach the old interface under the
+        # lock, but never hold it across interface construction or
+        # getMyNodeInfo(), which can block for many seconds
+        with self.lock:
+            # Don't start a multi-second connect once shutdown has begun
+            if self.stop_event.is_set():
+                logger.info("Shutdown requested, not connecting")
+                return False
 
-        def _connect_internal() -> bool:
-            """Internal connection logic with proper cleanup"""
             # Check if connection is already in progress
             if self.connection_in_progress:
-                logging.info("Connection already in progress, skipping")
+                logger.info("Connection already in progress, skipping")
                 return False
 
-            # Check for existing connections
-            if self._check_existing_connections():
-                logging.info(
-                    "Existing connection found, will be cleaned up before new connection"
-                )
-
             self.connection_in_progress = True
-            try:
-                # Always close existing interface first
-                self._close_interface_safely()
+            old_interface = self.interface
+            if old_interface is not None:
+                logger.debug("Existing interface found, reusing or replacing it")
+            self.interface = None
+            self.connected = False
 
-                if self.connection_type == "tcp" and self.node_ip:
-                    logging.info(f"Connecting to Meshtastic node at {self.node_ip}")
-                    self.interface = meshtastic.tcp_interface.TCPInterface(
-                        hostname=self.node_ip
-                    )
-                    logging.info(f"TCPInterface created successfully: {self.interface}")
+        try:
+            return self._connect_internal(old_interface)
+        finally:
+            with self.lock:
+                self.connection_in_progress = False
 
-                    # Log socket information for debugging
-                    if hasattr(self.interface, "socket") and self.interface.socket:
-                        logging.debug(f"Socket created: {self.interface.socket}")
-                        try:
-                            socket_info = self.interface.socket.getsockname()
-                            logging.debug(f"Socket local address: {socket_info}")
-                        except Exception as e:
-                            logging.debug(f"Could not get socket info: {e}")
-
-                elif self.connection_type == "serial":
-                    logging.info(
-                        f"Connecting to Meshtastic node via serial at {self.serial_port}"
-                    )
-                    self.interface = meshtastic.serial_interface.SerialInterface(
-                        self.serial_port, debugOut=False
+    def _open_tcp_interface(self, hostname: str) -> Any:
+        """Build a TCPInterface whose socket connect is bounded by connect_timeout"""
+        # Connect outside the constructor so a failed handshake is closed on
+        # the closer thread rather than inline
+        interface = _TCPInterface(
+            hostname, connect_timeout=self.connect_timeout, connectNow=False
+        )
+        try:
+            interface.connect()
+            sock = interface.socket
+            if sock is not None:
+                # A connected socket's local address never changes; look it up once
+                self._sockname = (sock, sock.getsockname())
+                logger.debug("Socket local address: %s", self._sockname[1])
+            interface.waitForConfig()
+        except Exception:
+            self._close_interface_async(interface)
+            raise
+        return interface
+
+    @staticmethod
+    def _read_node_id(interface: Any) -> str | None:
+        """Return the local node's "!xxxxxxxx" id, or None if not known yet"""
+        # myInfo.my_node_num is all we need; only fall back to the node-info
+        # lookup when it isn't available
+        my_info = getattr(interface, "myInfo", None)
+        node_num = getattr(my_info, "my_node_num", None)
+        if isinstance(node_num, int) and node_num:
+            return f"!{node_num:08x}"
+        node_info = interface.getMyNodeInfo()
+        if node_info is None:
+            return None
+        return node_info["user"]["id"]
+
+    def _mark_connected(self, interface: Any, node_id: str) -> None:
+        """Publish a working interface in one short critical section"""
+        now = time.monotonic()
+        with self.lock:
+            self.interface = interface
+            self.connected_node_id = node_id
+            self.connected = True
+            self.connection_errors = 0
+            self._force_rebuild = False
+            self._retries_since_last_success = 0
+            self.last_heartbeat = now
+            self.last_successful_health_check = now
+            self.last_connection_time = (
+                now  # Update last connection time on successful connection
+            )
+
+            # Start health monitor after first successful connection
+            if self.health_thread is None or not self.health_thread.is_alive():
+                logger.info("Starting health monitor thread...")
+                self.health_thread = threading.Thread(
+                    target=self._health_monitor, daemon=True
+                )
+                self.health_thread.start()
+
+    def _wait_for_config_complete(self, interface: Any) -> bool:
+        """Wait until meshtastic reports config complete, or shutdown/timeout"""
+        # meshtastic sets isConnected when the config-complete message arrives,
+        # right before publishing meshtastic.connection.established
+        is_connected = getattr(interface, "isConnected", None)
+        if not isinstance(is_connected, threading.Event):
+            return True
+        if is_connected.is_set():
+            return True
+
+        logger.info("Waiting for node to finish sending its config...")
+        deadline = time.monotonic() + _CONFIG_COMPLETE_TIMEOUT
+        while not self.stop_event.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            if is_connected.wait(timeout=min(1.0, remaining)):
+                return True
+        return False
+
+    def _run_probe(
+        self, interface: Any, deep: bool, timeout: float
+    ) -> _HealthCheckResult:
+        """Run _do_health_check on the probe worker, raising TimeoutError if slow"""
+        with self.lock:
+            previous = self._probe_future
+            if previous is not None and not previous.done():
+                # The last probe is still stuck inside meshtastic; abandon that
+                # worker rather than queue behind it. Its thread exits if the
+                # call ever returns.
+                logger.warning("Previous health probe still running, replacing worker")
+                self._probe_worker.shutdown()
+                self._probe_worker = _DaemonWorker("mesh-probe")
+            result = _HealthCheckResult()
+            future = self._probe_worker.submit(
+                _do_health_check, interface, result, deep
+            )
+            self._probe_future = future
+        try:
+            future.result(timeout=timeout)
+        except TimeoutError:
+            raise TimeoutError(
+                f"Health check timed out after {timeout} seconds"
+            ) from None
+        return result
+
+    def _try_reuse_interface(self, interface: Any) -> bool:
+        """Quickly probe the old interface and keep it if it is still healthy"""
+        if self._force_rebuild or self.is_packet_timeout_expired():
+            # Silence from the node is exactly what a rebuild is meant to fix
+            return False
+        # meshtastic clears isConnected when its reader sees the link drop
+        is_connected = getattr(interface, "isConnected", None)
+        if isinstance(is_connected, threading.Event) and not is_connected.is_set():
+            return False
+
+        try:
+            result = self._run_probe(interface, True, _REUSE_PROBE_TIMEOUT)
+        except TimeoutError:
+            return False
+        if not result.success:
+            return False
+
+        node_id = self._read_node_id(interface)
+        if node_id is None:
+            return False
+        logger.info("Existing interface passed quick probe, reusing it")
+        self._mark_connected(interface, node_id)
+        return True
+
+    def _connect_internal(self, old_interface: Any) -> bool:
+        """Internal connection logic with proper cleanup, run without self.lock"""
+        interface: Any = None
+        try:
+            # A transient error may have left the old interface usable; reusing
+            # it skips the node's full config replay on a fresh TCPInterface
+            if old_interface and self._try_reuse_interface(old_interface):
+                return True
+
+            # Otherwise close the existing interface first. Nodes accept a
+            # single TCP client, so wait for it, but never let a hung close
+            # block recovery indefinitely
+            if old_interface:
+                try:
+                    self._close_interface_async(old_interface).result(
+                        timeout=_CLOSE_TIMEOUT
                     )
-                    logging.info(
-                        f"SerialInterface created successfully: {self.interface}"
+                except TimeoutError:
+                    logger.warning(
+                        "Closing old interface took over %ss, continuing with new connection",
+                        _CLOSE_TIMEOUT,
                     )
 
-                # Test connection by getting node info
-                logging.info("Testing connection by calling getMyNodeInfo()...")
-                self.node_info = self.interface.getMyNodeInfo()
-                logging.info(f"getMyNodeInfo() returned: {self.node_info}")
-                if self.node_info is None:
-                    raise Exception(
-                        "Failed to get node info - connection may be invalid"
-                    )
-                self.connected_node_id = self.node_info["user"]["id"]
+            if self.connection_type == "tcp" and self.node_ip:
+                logger.info("Connecting to Meshtastic node at %s", self.node_ip)
+                interface = self._open_tcp_interface(self.node_ip)
+                logger.info("TCPInterface created successfully: %s", interface)
 
-                self.connected = True
-                self.connection_errors = 0
-                self.last_heartbeat = time.time()
-                self.last_successful_health_check = time.time()
-                self.last_connection_time = (
-                    time.time()
-                )  # Update last connection time on successful connection
-
-                logging.info(f"Successfully connected to node {self.connected_node_id}")
-                
-                # Start health monitor after first successful connection
-                if self.health_thread is None or not self.health_thread.is_alive():
-                    logging.info("Starting health monitor thread...")
-                    self.health_thread = threading.Thread(target=self._health_monitor, daemon=True)
-                    self.health_thread.start()
-                
-                return True
+            elif self.connection_type == "serial":
+                logger.info(
+                    "Connecting to Meshtastic node via serial at %s", self.serial_port
+                )
+                interface = meshtastic.serial_interface.SerialInterface(
+                    self.serial_port, debugOut=False
+                )
+                logger.info("SerialInterface created successfully: %s", interface)
 
-            except Exception as e:
-                error_str = str(e).lower()
-                if any(
-                    keyword in error_str
-                    for keyword in [
-                        "broken pipe",
-                        "connection reset",
-                        "connection refused",
-                        "serial",
-                        "timeout",
-                    ]
-                ):
-                    logging.warning(
-                        f"Connection error detected (likely remote server issue): {e}"
+            # Don't declare success while the node is still streaming config;
+            # requests sent during the dump are what trigger ECONNRESET
+            if not self._wait_for_config_complete(interface):
+                raise Exception("Timed out waiting for node config to complete")
+
+            # Test connection by reading the local node id
+            connected_node_id = self._read_node_id(interface)
+            if connected_node_id is None:
+                raise Exception("Failed to get node info - connection may be invalid")
+
+            self._mark_connected(interface, connected_node_id)
+            logger.info("Successfully connected to node %s", connected_node_id)
+            return True
+
+        except Exception as e:
+            with self.lock:
+                if _CONN_ERR_RE.search(str(e)):
+                    logger.warning(
+                        "Connection error detected (likely remote server issue): %s", e
                     )
                     # For these specific errors, don't increment connection_errors as aggressively
                     # since they're likely server-side issues
-                    if (
-                        self.connection_errors < 5
-                    ):  # Only increment if we haven't had too many errors
-                        self.connection_errors += 1
+                    self._bump_errors(limit=5)
                 else:
-                    logging.error(f"Failed to connect to Meshtastic node: {e}")
-                    self.connection_errors += 1
+                    logger.error("Failed to connect to Meshtastic node: %s", e)
+                    self._bump_errors()
 
                 self.connected = False
-                # Clean up failed interface
-                self._close_interface_safely()
-                return False
-            finally:
-                self.connection_in_progress = False
 
-        if skip_lock:
-            # Health monitor thread - use existing lock to prevent race conditions
-            with self.lock:
-                return _connect_internal()
-        else:
-            # Main thread - use lock
-            with self.lock:
-                return _connect_internal()
+            # Clean up failed interface without waiting on it
+            if interface:
+                self._close_interface_async(interface)
+            return False
 
-    def reconnect(self, skip_lock: bool = False) -> bool:
+    def reconnect(self) -> bool:
         """Attempt to reconnect with exponential backoff and proper synchronization"""
-        logging.info(f"reconnect() called with skip_lock={skip_lock}")
+        return self._reconnect(wait=True)
 
-        def _reconnect_internal() -> bool:
-            """Internal reconnection logic with proper state management"""
-            # Check if already reconnecting to prevent multiple simultaneous reconnections
-            if self.reconnecting:
-                logging.info("Reconnection already in progress, skipping")
-                return False
+    def _reconnect(self, wait: bool) -> bool:
+        """Run the reconnect loop, or join the one in flight if wait is set"""
+        logger.info("reconnect() called")
+        # Only one reconnect loop runs at a time; concurrent callers share its
+        # outcome instead of racing to tear down its fresh interface
+        with self.lock:
+            in_flight = self._reconnect_future
+            if in_flight is None:
+                future: Future[bool] = Future()
+                self._reconnect_future = future
+                self.reconnecting = True
+                # Recovery is now under way, so start counting errors afresh
+                self.connection_errors = 0
 
-            self.reconnecting = True
-            try:
-                attempts = 0
-                while (
-                    attempts < self.reconnect_attempts and not self.stop_event.is_set()
-                ):
-                    attempts += 1
-                    logging.info(
-                        f"Reconnection attempt {attempts}/{self.reconnect_attempts}"
-                    )
+        if in_flight is not None:
+            if not wait:
+                logger.debug("Reconnection already in progress, not waiting for it")
+                return False
+            logger.info("Reconnection already in progress, waiting for it")
+            return in_flight.result()
+
+        # The attempts and backoff waits run without self.lock so readers
+        # are never stalled
+        success = False
+        try:
+            success = self._reconnect_internal()
+            return success
+        finally:
+            with self.lock:
+                self.reconnecting = False
+                self._reconnect_future = None
+            future.set_result(success)
 
-                    logging.info("Calling connect() from reconnect()...")
-                    if self.connect(
-                        skip_lock=True
-                    ):  # Always use skip_lock=True for internal calls
-                        logging.info("connect() succeeded, reconnection successful")
-                        return True
-                    else:
-                        logging.warning("connect() failed")
+    def _backoff_delay(self, attempts: int) -> float:
+        """Backoff before the next attempt, capped and optionally jittered"""
+        delay = float(
+            min(self.reconnect_delay_max, self.reconnect_delay * (1 << (attempts - 1)))
+        )
+        if self.reconnect_jitter:
+            # Jitter keeps producers that lost the node together from
+            # retrying in lockstep
+            delay *= random.uniform(0.5, 1.0)
+        return delay
+
+    def _reconnect_internal(self) -> bool:
+        """Internal reconnection logic, run without self.lock"""
+        # A negative reconnect_attempts means keep trying until shutdown
+        max_attempts = (
+            float("inf") if self.reconnect_attempts < 0 else self.reconnect_attempts
+        )
+        attempts = 0
+        while attempts < max_attempts and not self.stop_event.is_set():
+            attempts += 1
+            logger.info("Reconnection attempt %s/%s", attempts, max_attempts)
+
+            logger.info("Calling connect() from reconnect()...")
+            if self.connect():
+                logger.info("connect() succeeded, reconnection successful")
+                return True
 
-                    # Check if shutdown was requested
-                    if self.stop_event.is_set():
-                        logging.info("Shutdown requested during reconnection, aborting")
-                        break
+            # Backoff keeps escalating across reconnect() calls until a
+            # connection succeeds, so repeated health-monitor triggers during
+            # a long outage don't restart from the base delay
+            self._retries_since_last_success += 1
+            retries = self._retries_since_last_success
+            # Warn once per _RETRY_WARN_EVERY failures to keep long outages quiet
+            logger.log(
+                logging.WARNING if retries % _RETRY_WARN_EVERY == 1 else logging.DEBUG,
+                "connect() failed (%d consecutive failures)",
+                retries,
+            )
 
-                    # Exponential backoff with interruptible wait
-                    delay = self.reconnect_delay * (2 ** (attempts - 1))
-                    logging.info(
-                        f"Reconnection failed, waiting {delay} seconds before next attempt"
-                    )
+            # Check if shutdown was requested
+            if self.stop_event.is_set():
+                logger.info("Shutdown requested during reconnection, aborting")
+                break
 
-                    # Use interruptible wait instead of time.sleep
-                    if self.stop_event.wait(timeout=delay):
-                        logging.info(
-                            "Shutdown requested during reconnection delay, aborting"
-                        )
-                        break
+            # Capped exponential backoff with interruptible wait
+            delay = self._backoff_delay(retries)
+            logger.info(
+                "Reconnection failed, waiting %.1f seconds before next attempt", delay
+            )
 
-                if self.stop_event.is_set():
-                    logging.info("Reconnection aborted due to shutdown")
-                else:
-                    logging.error("Max reconnection attempts reached")
-                return False
-            finally:
-                self.reconnecting = False
+            # Use interruptible wait instead of time.sleep
+            if self.stop_event.wait(timeout=delay):
+                logger.info("Shutdown requested during reconnection delay, aborting")
+                break
 
-        if skip_lock:
-            # Health monitor thread - use existing lock
-            with self.lock:
-                return _reconnect_internal()
+        if self.stop_event.is_set():
+            logger.info("Reconnection aborted due to shutdown")
         else:
-            # Main thread - use lock
-            with self.lock:
-                return _reconnect_internal()
+            logger.error("Max reconnection attempts reached")
+        return False
+
+    def request_reconnect(self) -> None:
+        """Ask the reconnect worker for a reconnection cycle and return at once"""
+        if self.stop_event.is_set():
+            return
+        with self.lock:
+            if self._reconnect_thread is None or not self._reconnect_thread.is_alive():
+                self._reconnect_thread = threading.Thread(
+                    target=self._reconnect_worker, daemon=True
+                )
+                self._reconnect_thread.start()
+        self._reconnect_q.put_nowait(True)
+
+    def _drain_reconnect_requests(self) -> None:
+        """Discard any queued reconnect requests"""
+        try:
+            while True:
+                self._reconnect_q.get_nowait()
+        except queue.Empty:
+            pass
+
+    def _reconnect_worker(self) -> None:
+        """Run reconnect() for queued requests, one cycle per burst"""
+        logger.info("Reconnect worker started")
+        while not self.stop_event.is_set():
+            if not self._reconnect_q.get():
+                break  # Shutdown sentinel from close()
+            # Requests that piled up behind this one are served by this cycle
+            self._drain_reconnect_requests()
+            if self.stop_event.is_set():
+                break
+            if self.reconnect():
+                # Errors reported while reconnecting refer to the old interface
+                self._drain_reconnect_requests()
+        logger.info("Reconnect worker exiting")
+
+    def _relax_health_interval(self) -> None:
+        """Stretch the health-check interval after a successful check"""
+        self._current_interval = min(
+            self._max_health_check_interval, self._current_interval * 1.5
+        )
 
     def _health_monitor(self) -> None:
         """Monitor connection health and trigger reconnection if needed"""
-        logging.info(
-            f"Health monitor started with {self.health_check_interval}s interval"
+        logger.info(
+            "Health monitor started with %ss interval", self.health_check_interval
         )
-        while not self.stop_event.is_set():
+        # wait() returns True once shutdown is requested, so this is the only
+        # stop_event check the loop needs; request_reconnect() checks it too
+        while not self.stop_event.wait(timeout=self._current_interval):
             try:
-                # Use wait() instead of sleep() so it's interruptible
-                if self.stop_event.wait(timeout=self.health_check_interval):
-                    # Event was set (shutdown requested), exit gracefully
-                    logging.info("Health monitor received shutdown signal, exiting")
-                    break
-
-                # Only continue if not shutting down
-                if self.stop_event.is_set():
-                    break
-
-                logging.debug("=== HEALTH MONITOR CYCLE START ===")
-
-                # Check connection status with proper locking
-                should_reconnect = False
+                # The reconnect worker owns the interface while it is busy
+                if self.reconnecting:
+                    logger.debug("Reconnection in progress, skipping health check")
+                    continue
+
+                # Sample the clock once per cycle
+                now = time.monotonic()
+                # A check counts as missed once two backed-off cycles pass
+                stale_after = max(30.0, 2 * self._current_interval)
+
+                # Snapshot the raw fields under the lock; the arithmetic and
+                # the decision below run after it is released
                 with self.lock:
                     current_connected = self.connected
                     current_errors = self.connection_errors
                     current_max_errors = self.max_connection_errors
                     interface_exists = self.interface is not None
-                    time_since_last_success = (
-                        time.time() - self.last_successful_health_check
+                    last_success = self.last_successful_health_check
+                    last_packet = self.last_packet_time
+                    last_connection = self.last_connection_time
+
+                time_since_last_success = now - last_success
+                time_since_last_packet = now - last_packet
+                time_since_last_connection = now - last_connection
+
+                should_reconnect = False
+                # Only attempt reconnection if we have been connected for at least min_connection_time
+                if (
+                    current_connected
+                    and time_since_last_connection < self.min_connection_time
+                ):
+                    logger.debug(
+                        "Not attempting reconnection due to minimum connection "
+                        "time (%.1fs < %ss)",
+                        time_since_last_connection,
+                        self.min_connection_time,
+                    )
+                elif (
+                    not current_connected
+                    or current_errors >= current_max_errors
+                    or time_since_last_success
+                    > stale_after  # Force reconnect if no recent successful check
+                    or time_since_last_packet > self.packet_timeout
+                ):
+                    should_reconnect = True
+
+                # Per-cycle output stays at DEBUG; INFO only hears about changes
+                if current_connected != self._last_logged_connected:
+                    self._last_logged_connected = current_connected
+                    logger.info(
+                        "Health monitor: connection is %s",
+                        "up" if current_connected else "down",
+                    )
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Health check status: connected=%s, errors=%d/%d, "
+                        "interface_exists=%s, should_reconnect=%s, "
+                        "time_since_last_success=%.1fs, time_since_last_packet=%.1fs, "
+                        "time_since_last_connection=%.1fs",
+                        current_connected,
+                        current_errors,
+                        current_max_errors,
+                        interface_exists,
+                        should_reconnect,
+                        time_since_last_success,
+                        time_since_last_packet,
+                        time_since_last_connection,
                     )
-                    time_since_last_packet = time.time() - self.last_packet_time
-                    time_since_last_connection = time.time() - self.last_connection_time
-
-                    # Only attempt reconnection if we have been connected for at least min_connection_time
-                    if (
-                        self.connected
-                        and time_since_last_connection < self.min_connection_time
-                    ):
-                        logging.debug(
-                            f"Not attempting reconnection due to minimum connection time ({time_since_last_connection:.1f}s < {self.min_connection_time}s)"
-                        )
-                        should_reconnect = False
-                    elif (
-                        not self.connected
-                        or self.connection_errors >= self.max_connection_errors
-                        or time_since_last_success
-                        > 30  # Force reconnect if no successful check in 30 seconds
-                        or time_since_last_packet > self.packet_timeout
-                    ):
-                        should_reconnect = True
-
-                logging.debug(
-                    f"Health check status: connected={current_connected}, errors={current_errors}/{current_max_errors}, interface_exists={interface_exists}, should_reconnect={should_reconnect}, time_since_last_success={time_since_last_success:.1f}s, time_since_last_packet={time_since_last_packet:.1f}s, time_since_last_connection={time_since_last_connection:.1f}s"
-                )
 
                 if should_reconnect:
-                    if time_since_last_success > 30:
-                        logging.warning(
-                            f"Connection health check failed - no successful check in {time_since_last_success:.1f}s, forcing reconnection"
+                    self._current_interval = self.health_check_interval
+                    if time_since_last_success > stale_after:
+                        logger.warning(
+                            "Connection health check failed - no successful check in %.1fs, forcing reconnection",
+                            time_since_last_success,
                         )
                     elif time_since_last_packet > self.packet_timeout:
-                        logging.warning(
-                            f"Connection health check failed - no packets received in {time_since_last_packet:.1f}s, forcing reconnection"
+                        logger.warning(
+                            "Connection health check failed - no packets received in %.1fs, forcing reconnection",
+                            time_since_last_packet,
                         )
                     else:
-                        logging.warning(
-                            f"Connection health check failed (connected={current_connected}, errors={current_errors}), attempting reconnection"
+                        logger.warning(
+                            "Connection health check failed (connected=%s, errors=%s), attempting reconnection",
+                            current_connected,
+                            current_errors,
                         )
-                    # Don't attempt reconnection if shutting down
-                    if not self.stop_event.is_set():
-                        logging.info("Calling reconnect() from health monitor...")
-                        self.reconnect(skip_lock=True)
-                        logging.info("reconnect() call completed")
+                    logger.info("Requesting reconnection from health monitor...")
+                    self.request_reconnect()
+                    continue
 
                 # Always check interface health if we have an interface, regardless of connected state
-                if self.interface and not self.stop_event.is_set():
-                    logging.debug("Interface exists, performing health check...")
+                if self.interface:
+                    logger.debug("Interface exists, performing health check...")
 
                     # Prevent overlapping health checks
                     if self.health_check_in_progress:
-                        logging.debug("Health check already in progress, skipping")
+                        logger.debug("Health check already in progress, skipping")
+                        continue
+
+                    # Debounce: fresh traffic already proves the interface works
+                    if self.connected and now - self.last_packet_time < self._probe_ttl:
+                        with self.lock:
+                            self.last_heartbeat = now
+                            self.last_successful_health_check = now
+                        self._relax_health_interval()
+                        logger.debug("Packet received recently, skipping health probe")
                         continue
 
                     self.health_check_in_progress = True
                     try:
                         # Use threading-based timeout for health check
-                        import threading
-
-                        class HealthCheckResult:
-                            def __init__(self):
-                                self.success: bool = False
-                                self.exception: Exception | None = None
+                        # The socket-level check is enough most cycles; only
+                        # every Nth one also verifies node info
+                        self._health_check_count += 1
+                        deep = self._health_check_count % _DEEP_CHECK_EVERY == 0
 
-                        result = HealthCheckResult()
-
-                        def health_check():
-                            nonlocal result
-                            try:
-                                logging.debug(
-                                    "Health check: calling getMyNodeInfo()..."
-                                )
-                                node_info = self.interface.getMyNodeInfo()
-                                logging.debug(
-                                    f"Health check: getMyNodeInfo() returned: {node_info}"
-                                )
-                                if node_info is None:
-                                    raise Exception("getMyNodeInfo returned None")
-
-                                # Additional check: verify the interface socket is still valid
-                                if (
-                                    hasattr(self.interface, "socket")
-                                    and self.interface.socket
-                                ):
-                                    try:
-                                        # Try to get socket info to verify it's still connected
-                                        socket_info = self.interface.socket.getsockopt(
-                                            1, 1
-                                        )  # SOL_SOCKET, SO_ERROR
-                                        if socket_info != 0:
-                                            raise Exception(
-                                                f"Socket error detected: {socket_info}"
-                                            )
-                                        logging.debug("Socket health check passed")
-                                    except Exception as socket_e:
-                                        logging.warning(
-                                            f"Socket health check failed: {socket_e}"
-                                        )
-                                        raise Exception(
-                                            f"Socket connection broken: {socket_e}"
-                                        ) from socket_e
-
-                                result.success = True  # noqa: B023
-                                logging.debug("Health check: getMyNodeInfo() succeeded")
-                            except Exception as e:
-                                logging.error(
-                                    f"Health check: getMyNodeInfo() failed with exception: {e}"
-                                )
-                                result.exception = e  # noqa: B023
-
-                        # Run health check in separate thread with timeout
-                        health_thread = threading.Thread(
-                            target=health_check, daemon=True
-                        )
-                        logging.debug("Starting health check thread...")
-                        health_thread.start()
-                        health_thread.join(
-                            timeout=5
-                        )  # Reduced timeout to 5 seconds for faster detection
-
-                        if health_thread.is_alive():
-                            # Thread is still running, timeout occurred
-                            logging.warning("Health check timed out after 5 seconds")
-                            raise TimeoutError("Health check timed out after 5 seconds")
-
-                        logging.debug(
-                            f"Health check result: success={result.success}, exception={result.exception}"
+                        # Run the probe on the probe worker with a 5s timeout
+                        try:
+                            result = self._run_probe(self.interface, deep, 5)
+                        except TimeoutError:
+                            logger.warning("Health check timed out after 5 seconds")
+                            raise
+
+                        logger.debug(
+                            "Health check result: success=%s, exception=%s",
+                            result.success,
+                            result.exception,
                         )
 
                         if result.success:
                             # Update last heartbeat and reset errors on success
+                            success_time = time.monotonic()
                             with self.lock:
-                                self.last_heartbeat = time.time()
+                                self.last_heartbeat = success_time
                                 self.connection_errors = 0
                                 self.connected = True  # Ensure connected state is set
-                                self.last_successful_health_check = time.time()  # Update last successful check on successful health check
-                            logging.debug(
+                                self.last_successful_health_check = success_time
+                            self._relax_health_interval()
+                            logger.debug(
                                 "Health check passed successfully, reset errors and updated heartbeat"
                             )
                         else:
                             # Health check failed
                             if result.exception is not None:
-                                logging.error(
-                                    f"Health check failed with exception: {result.exception}"
+                                logger.error(
+                                    "Health check failed with exception: %s",
+                                    result.exception,
                                 )
                                 raise result.exception
                             else:
-                                logging.error("Health check failed with unknown error")
+                                logger.error("Health check failed with unknown error")
                                 raise Exception("Health check failed")
 
                     except (Exception, TimeoutError) as e:
-                        error_str = str(e).lower()
-                        if any(
-                            keyword in error_str
-                            for keyword in [
-                                "broken pipe",
-                                "connection reset",
-                                "connection refused",
-                            ]
-                        ):
-                            logging.warning(
-                                f"Health check failed with connection error (likely server issue): {e}"
+                        self._current_interval = self.health_check_interval
+                        if _LINK_ERR_RE.search(str(e)):
+                            logger.warning(
+                                "Health check failed with connection error (likely server issue): %s",
+                                e,
                             )
                             # For connection errors, be less aggressive about incrementing errors
                             with self.lock:
                                 self.connected = False
-                                if (
-                                    self.connection_errors < 5
-                                ):  # Only increment if we haven't had too many errors
-                                    self.connection_errors += 1
+                                self._bump_errors(limit=5)
                         else:
-                            logging.warning(f"Health check failed: {e}")
+                            logger.warning("Health check failed: %s", e)
                             with self.lock:
                                 self.connected = False
-                                self.connection_errors += 1
+                                self._bump_errors()
 
                         # Immediately trigger reconnection on health check failure
-                        if not self.stop_event.is_set():
-                            logging.info(
-                                "Health check failed, triggering immediate reconnection"
-                            )
-                            self.reconnect(skip_lock=True)
+                        logger.info(
+                            "Health check failed, triggering immediate reconnection"
+                        )
+                        self.request_reconnect()
                     finally:
                         self.health_check_in_progress = False
-                elif not self.interface and not self.stop_event.is_set():
+                else:
                     # No interface exists, try to reconnect
-                    logging.warning("No interface exists, attempting reconnection")
+                    logger.warning("No interface exists, attempting reconnection")
+                    self._current_interval = self.health_check_interval
                     with self.lock:
                         self.connected = False
-                        self.connection_errors += 1
+                        self._bump_errors()
 
-                    if not self.stop_event.is_set():
-                        self.reconnect(skip_lock=True)
-                else:
-                    logging.debug(
-                        "Skipping health check - interface doesn't exist or shutdown requested"
-                    )
-
-                logging.debug("=== HEALTH MONITOR CYCLE END ===")
+                    self.request_reconnect()
 
             except Exception as e:
-                logging.error(f"Error in health monitor: {e}")
+                logger.error("Error in health monitor: %s", e)
                 # Don't let exceptions kill the health monitor thread
-                time.sleep(1)
+                if self.stop_event.wait(timeout=1):
+                    break
 
-        logging.info("Health monitor thread exiting cleanly")
+        logger.info("Health monitor thread exiting cleanly")
 
     def is_connected(self) -> bool:
-        """Check if currently connected"""
-        return self.connected and self.interface is not None
+        """Check if currently connected (lock-free, safe to call per publish)"""
+        return self._is_connected_cached
+
+    def _cached_status(
+        self, key: str, build: Callable[[], dict[str, Any]]
+    ) -> dict[str, Any]:
+        """Return a copy of a status dict, rebuilding it at most once per TTL"""
+        now = time.monotonic()
+        entry = self._status_cache.get(key)
+        if entry is None or now >= entry[0]:
+            entry = (now + self._status_ttl, build())
+            self._status_cache[key] = entry
+        return dict(entry[1])
 
     def get_connection_info(self) -> dict[str, Any]:
         """Get detailed connection information for debugging"""
+        return self._cached_status("connection_info", self._build_connection_info)
+
+    def _build_connection_info(self) -> dict[str, Any]:
         with self.lock:
+            interface = self.interface
             info = {
                 "node_ip": self.node_ip,
                 "serial_port": self.serial_port,
@@ -560,110 +1044,172 @@ class ConnectionManager:
                 "health_check_in_progress": self.health_check_in_progress,
             }
 
-            if (
-                self.interface
-                and hasattr(self.interface, "socket")
-                and self.interface.socket
-            ):
-                try:
-                    socket = self.interface.socket
-                    info["socket_local"] = socket.getsockname()
-                    info["socket_remote"] = socket.getpeername()
-                    info["socket_fileno"] = socket.fileno()
-                except Exception as e:
-                    info["socket_error"] = str(e)
-            elif self.interface and hasattr(self.interface, "port"):
-                info["serial_port"] = self.interface.port
+        # Socket syscalls happen outside the lock
+        sock = getattr(interface, "socket", None)
+        if sock:
+            try:
+                cached = self._sockname
+                if cached is None or cached[0] is not sock:
+                    cached = self._sockname = (sock, sock.getsockname())
+                info["socket_local"] = cached[1]
+                # Left live: it fails once the peer is gone, which is useful here
+                info["socket_remote"] = sock.getpeername()
+                info["socket_fileno"] = sock.fileno()
+            except Exception as e:
+                info["socket_error"] = str(e)
+        elif interface and hasattr(interface, "port"):
+            info["serial_port"] = interface.port
 
-            return info
+        return info
 
     def get_health_status(self) -> dict[str, Any]:
-        """Get detailed health status for debugging"""
-        with self.lock:
-            return {
-                "connected": self.connected,
-                "connection_errors": self.connection_errors,
-                "max_connection_errors": self.max_connection_errors,
-                "last_heartbeat": self.last_heartbeat,
-                "last_packet_time": self.last_packet_time,
-                "packet_timeout": self.packet_timeout,
-                "health_monitor_alive": hasattr(self, "health_thread")
-                and self.health_thread.is_alive(),
-                "stop_event_set": self.stop_event.is_set(),
-                "interface_exists": self.interface is not None,
-                "connected_node_id": self.connected_node_id,
-                "health_check_interval": self.health_check_interval,
-                "time_since_last_heartbeat": time.time() - self.last_heartbeat
-                if self.last_heartbeat
-                else None,
-                "time_since_last_packet": time.time() - self.last_packet_time
-                if self.last_packet_time
-                else None,
-                "reconnecting": self.reconnecting,
-                "health_check_in_progress": self.health_check_in_progress,
-                "connection_in_progress": self.connection_in_progress,
-                "last_connection_time": self.last_connection_time,
-                "min_connection_time": self.min_connection_time,
-                "time_since_last_connection": time.time() - self.last_connection_time
-                if self.last_connection_time
-                else None,
-            }
+        """
+        Get detailed health status for debugging.
+
+        Timestamps (last_heartbeat, last_packet_time, last_connection_time) are
+        time.monotonic() values and only meaningful relative to each other; use
+        the time_since_* fields for elapsed seconds.
+        """
+        return self._cached_status("health_status", self._build_health_status)
+
+    def _build_health_status(self) -> dict[str, Any]:
+        # Single attribute reads are atomic under the GIL, so snapshot into
+        # locals without taking self.lock; only state transitions need it.
+        now = time.monotonic()
+        last_heartbeat = self.last_heartbeat
+        last_packet_time = self.last_packet_time
+        last_connection_time = self.last_connection_time
+        return {
+            "connected": self.connected,
+            "connection_errors": self.connection_errors,
+            "max_connection_errors": self.max_connection_errors,
+            "last_heartbeat": last_heartbeat,
+            "last_packet_time": last_packet_time,
+            "packet_timeout": self.packet_timeout,
+            "health_monitor_alive": self.is_health_monitor_working(),
+            "stop_event_set": self.stop_event.is_set(),
+            "interface_exists": self.interface is not None,
+            "connected_node_id": self.connected_node_id,
+            "health_check_interval": self.health_check_interval,
+            "current_health_check_interval": self._current_interval,
+            "time_since_last_heartbeat": now - last_heartbeat
+            if last_heartbeat
+            else None,
+            "time_since_last_packet": now - last_packet_time
+            if last_packet_time
+            else None,
+            "reconnecting": self.reconnecting,
+            "health_check_in_progress": self.health_check_in_progress,
+            "connection_in_progress": self.connection_in_progress,
+            "last_connection_time": last_connection_time,
+            "min_connection_time": self.min_connection_time,
+            "time_since_last_connection": now - last_connection_time
+            if last_connection_time
+            else None,
+        }
 
     def is_health_monitor_working(self) -> bool:
         """Check if the health monitor thread is alive and working"""
-        return hasattr(self, "health_thread") and self.health_thread.is_alive()
+        return self.health_thread is not None and self.health_thread.is_alive()
 
     def is_packet_timeout_expired(self) -> bool:
         """Check if the packet timeout has expired (no packets received for packet_timeout seconds)"""
         with self.lock:
-            return time.time() - self.last_packet_time > self.packet_timeout
+            return time.monotonic() - self.last_packet_time > self.packet_timeout
 
     def force_reconnect(self) -> None:
         """Force immediate reconnection - useful when connection errors are detected externally"""
-        logging.warning(
-            "Forcing immediate reconnection due to external error detection"
-        )
+        logger.warning("Forcing immediate reconnection due to external error detection")
         with self.lock:
             self.connected = False
-            self.connection_errors += 1
+            self._force_rebuild = True
+            self._bump_errors()
 
-        if not self.stop_event.is_set():
-            self.reconnect(skip_lock=True)
+        self.request_reconnect()
 
     def handle_external_error(self, error_msg: str) -> None:
         """Handle external connection errors (like 'Connection refused')"""
-        logging.warning(f"Handling external connection error: {error_msg}")
+        # A flapping link can deliver a burst of disconnect events; treat
+        # those arriving within the debounce window as one transition
+        now = time.monotonic()
+        with self.lock:
+            coalesce = (
+                now - self._last_external_error_time < self.external_error_debounce
+            )
+            if not coalesce:
+                self._last_external_error_time = now
+        if coalesce:
+            logger.debug("Coalescing external connection error: %s", error_msg)
+            return
+
+        logger.warning("Handling external connection error: %s", error_msg)
         with self.lock:
             self.connected = False
-            self.connection_errors += 1
-            logging.info(
-                f"Updated connection state: connected=False, errors={self.connection_errors}"
+            self._bump_errors()
+            logger.info(
+                "Updated connection state: connected=False, errors=%s",
+                self.connection_errors,
             )
 
-        if not self.stop_event.is_set():
-            logging.info("Triggering immediate reconnection due to external error")
-            self.reconnect(skip_lock=True)
+        logger.info("Triggering immediate reconnection due to external error")
+        self.request_reconnect()
 
     def get_interface(self) -> Any | None:
-        """Get the current interface, reconnecting if necessary"""
-        if not self.is_connected():
-            if not self.reconnect():
-                return None
+        """Get the current interface, or None while a reconnect is scheduled"""
+        # Read the cached flag directly; this sits on the per-send path
+        if not self._is_connected_cached:
+            # Callers here are paho's network loop and meshtastic's receive
+            # thread, so the attempts and backoff run on the reconnect worker
+            self.request_reconnect()
+            return None
         return self.interface
 
     def close(self) -> None:
         """Close the connection and stop monitoring"""
-        logging.info("ConnectionManager closing...")
+        with self.lock:
+            if self._closed:
+                return
+            self._closed = True
+        logger.info("ConnectionManager closing...")
         self.stop_event.set()
 
         # Wait for health monitor thread to finish
-        if hasattr(self, "health_thread") and self.health_thread.is_alive():
-            logging.info("Waiting for health monitor thread to finish...")
-            self.health_thread.join(timeout=2.0)  # 2 second timeout
-            if self.health_thread.is_alive():
-                logging.warning("Health monitor thread did not finish cleanly")
+        # health_thread is None until the first successful connection
+        health_thread = self.health_thread
+        if health_thread is not None and health_thread.is_alive():
+            logger.info("Waiting for health monitor thread to finish...")
+            health_thread.join(timeout=2.0)  # 2 second timeout
+            if health_thread.is_alive():
+                logger.warning("Health monitor thread did not finish cleanly")
             else:
-                logging.info("Health monitor thread finished cleanly")
-
-        # Close interface with proper cleanup
+                logger.info("Health monitor thread finished cleanly")
+
+        # Wake the reconnect worker so it can exit, then drop pending requests
+        self._reconnect_q.put_nowait(False)
+        if self._reconnect_thread is not None and self._reconnect_thread.is_alive():
+            self._reconnect_thread.join(timeout=2.0)
+            if self._reconnect_thread.is_alive():
+                logger.warning("Reconnect worker did not finish cleanly")
+        self._drain_reconnect_requests()
+
+        # Close interface with proper cleanup, then give queued closes a
+        # bounded chance to finish. The closer is a daemon thread, so a close
+        # that hangs can hold up neither this call nor interpreter exit.
         self._close_interface_safely()
+        try:
+            self._closer.submit(lambda: None).result(timeout=_CLOSE_TIMEOUT)
+        except RuntimeError:
+            pass  # Closer already shut down; nothing left to wait for
+        except TimeoutError:
+            logger.warning(
+                "Interface close did not finish within %ss, abandoning it",
+                _CLOSE_TIMEOUT,
+            )
+        self._closer.shutdown()
+        self._probe_worker.shutdown()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -1,7 +1,6 @@
 import queue
-import threading
 from collections.abc import Callable
-from typing import Any
+from typing import Any, Literal
 
 
 class DeduplicatedQueue[T]:
@@ -10,17 +9,35 @@ class DeduplicatedQueue[T]:
     Thread-safe and supports the same basic interface as queue.Queue.
     """
 
-    def __init__(self, key_func: Callable[[T], Any] | None = None) -> None:
+    def __init__(
+        self,
+        key_func: Callable[[T], Any] | None = None,
+        maxsize: int = 0,
+        overflow: Literal["drop_new", "drop_oldest"] = "drop_new",
+    ) -> None:
         """
         Initialize the deduplicated queue.
 
         Args:
             key_func: Function to extract the key from queue items for deduplication.
                      If None, the item itself is used as the key.
+            maxsize: Maximum number of queued items; 0 or less means unbounded.
+                     The bound is approximate when several threads put at once.
+            overflow: What put() does when the queue is full: "drop_new" rejects
+                     the new item, "drop_oldest" discards the oldest queued item.
         """
-        self._queue: queue.Queue[T] = queue.Queue()
-        self._queued_items: set[Any] = set()
-        self._lock = threading.Lock()
+        if overflow not in ("drop_new", "drop_oldest"):
+            raise ValueError("overflow must be 'drop_new' or 'drop_oldest'")
+        self._maxsize = maxsize
+        self._overflow = overflow
+        # SimpleQueue is implemented in C and has no condition-variable
+        # machinery; the task_done()/join() support of Queue is never used.
+        # Entries carry their key so get() doesn't call key_func again.
+        self._queue: queue.SimpleQueue[tuple[Any, T]] = queue.SimpleQueue()
+        # Keys currently in the queue. dict.setdefault() is a single atomic
+        # check-and-insert under the GIL, so no lock beyond the queue's own
+        # is needed. A free-threaded build would need a lock around it again.
+        self._queued_items: dict[Any, object] = {}
         self._key_func: Callable[[T], Any] = key_func or (lambda x: x)
 
     def put(self, item: T) -> bool:
@@ -31,17 +48,27 @@ class DeduplicatedQueue[T]:
             item: The item to add to the queue
 
         Returns:
-            bool: True if item was added, False if it was already queued
+            bool: True if item was added, False if it was already queued or
+                  the queue is full under the "drop_new" policy
         """
         key = self._key_func(item)
+        if key in self._queued_items:
+            return False
 
-        with self._lock:
-            if key not in self._queued_items:
-                self._queue.put(item)
-                self._queued_items.add(key)
-                return True
-            else:
+        if 0 < self._maxsize <= len(self._queued_items):
+            if self._overflow == "drop_new":
                 return False
+            try:
+                old_key, _ = self._queue.get_nowait()
+                self._queued_items.pop(old_key, None)
+            except queue.Empty:
+                pass
+
+        token = object()
+        if self._queued_items.setdefault(key, token) is not token:
+            return False
+        self._queue.put((key, item))
+        return True
 
     def get(self, block: bool = True, timeout: float | None = None) -> T:
         """
@@ -54,14 +81,33 @@ class DeduplicatedQueue[T]:
         Returns:
             The next item from the queue
         """
-        item = self._queue.get(block, timeout)
-        key = self._key_func(item)
-
-        with self._lock:
-            self._queued_items.discard(key)
+        key, item = self._queue.get(block, timeout)
+        self._queued_items.pop(key, None)
 
         return item
 
+    def get_batch(self, max_items: int = 64, timeout: float | None = None) -> list[T]:
+        """
+        Get up to max_items items, blocking only for the first one.
+
+        Args:
+            max_items: Maximum number of items to return
+            timeout: Timeout for blocking on the first item
+
+        Returns:
+            The dequeued items, oldest first
+        """
+        entries = [self._queue.get(True, timeout)]
+        while len(entries) < max_items:
+            try:
+                entries.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+
+        for key, _ in entries:
+            self._queued_items.pop(key, None)
+        return [item for _, item in entries]
+
     def empty(self) -> bool:
         """Check if the queue is empty."""
         return self._queue.empty()
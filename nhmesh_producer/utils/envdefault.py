@@ -7,12 +7,8 @@ class EnvDefault(argparse.Action):
     def __init__(
         self, envvar: str, required: bool = True, default: Any = None, **kwargs: Any
     ) -> None:
-        if envvar:
-            if envvar in os.environ:
-                default = os.environ[envvar]
-        if required and default:
-            required = False
-        super().__init__(default=default, required=required, **kwargs)
+        default = os.environ.get(envvar, default) if envvar else default
+        super().__init__(default=default, required=required and not default, **kwargs)
 
     def __call__(
         self,
@@ -1,3 +1,4 @@
+import heapq
 import json
 import logging
 import os
@@ -9,6 +10,10 @@ from typing import Any
 
 from nhmesh_producer.utils.deduplicated_queue import DeduplicatedQueue
 
+# State changes are written out at most this long after the first unsaved one,
+# so a burst of successes/failures costs a single write
+_STATE_FLUSH_DELAY = 1.0
+
 
 class TracerouteManager:
     """
@@ -21,6 +26,7 @@ class TracerouteManager:
     - TRACEROUTE_MAX_BACKOFF: Maximum backoff time in seconds (default: 86400 = 24 hours)
     - TRACEROUTE_SEND_TIMEOUT: Timeout for individual traceroute send operations in seconds (default: 30)
     - TRACEROUTE_MAX_THREADS: Maximum number of concurrent traceroute threads (default: 2)
+    - TRACEROUTE_MAX_QUEUE: Maximum number of queued traceroute jobs; further jobs are dropped (default: 1024)
     - TRACEROUTE_PERSISTENCE_FILE: Path to file for persisting retry/backoff state (default: /tmp/traceroute_state.json)
     """
 
@@ -60,7 +66,9 @@ class TracerouteManager:
             if traceroute_cooldown is not None
             else int(os.getenv("TRACEROUTE_COOLDOWN", 3 * 60))
         )  # Default: 3 minutes
-        self._last_global_traceroute_time: float = 0  # Global cooldown timestamp
+        # Global cooldown timestamp; in-memory only, so it uses time.monotonic()
+        # (per-node times below are persisted and stay on wall-clock time)
+        self._last_global_traceroute_time: float = float("-inf")
         self._MAX_RETRIES: int = (
             max_retries
             if max_retries is not None
@@ -71,6 +79,9 @@ class TracerouteManager:
             if max_backoff is not None
             else int(os.getenv("TRACEROUTE_MAX_BACKOFF", 24 * 60 * 60))
         )  # Default: 24 hours
+        self._SEND_TIMEOUT: int = int(
+            os.getenv("TRACEROUTE_SEND_TIMEOUT", 30)
+        )  # Default: 30 seconds
 
         # Persistence configuration
         self._persistence_file = traceroute_persistence_file
@@ -87,14 +98,31 @@ class TracerouteManager:
             str, float
         ] = {}  # node_id -> timestamp when node can be retried again
 
+        # Bumped on every state change; _save_state() skips the write when the
+        # generation it last saved is still current
+        self._state_gen = 0
+        self._saved_gen = 0
+        # Generation last flushed to disk with fsync
+        self._synced_gen = 0
+
         # Load persisted state
         self._load_state()
 
         # Queue and threading
+        # Jobs are deduplicated per node, and the cap bounds the queue even if a
+        # long outage keeps jobs from draining on a very large mesh
+        max_queue = int(os.getenv("TRACEROUTE_MAX_QUEUE", 1024))
         self._traceroute_queue: DeduplicatedQueue[tuple[str, int]] = DeduplicatedQueue(
-            key_func=lambda x: x[0]
+            key_func=lambda x: x[0], maxsize=max_queue
         )
         self._shutdown_flag = threading.Event()  # Flag to signal shutdown
+        self._state_dirty = threading.Event()  # Set when state has unsaved changes
+
+        # Jobs for nodes in backoff wait here, ordered by when they become
+        # due, instead of cycling through the queue
+        self._retry_lock = threading.Lock()
+        self._retry_heap: list[tuple[float, str, int]] = []
+        self._retry_scheduled: set[str] = set()
 
         # Thread pool for non-blocking traceroute execution with limited concurrency
         max_traceroute_threads = int(os.getenv("TRACEROUTE_MAX_THREADS", 2))
@@ -107,13 +135,22 @@ class TracerouteManager:
             target=self._traceroute_worker, daemon=True
         )
         self._traceroute_worker_thread.start()
+        self._state_flusher_thread = threading.Thread(
+            target=self._state_flusher, daemon=True
+        )
+        self._state_flusher_thread.start()
         logging.info(
-            f"Traceroute worker thread started with single-threaded processing and {self._TRACEROUTE_COOLDOWN}s cooldown."
+            "Traceroute worker thread started with single-threaded processing and %ss cooldown.",
+            self._TRACEROUTE_COOLDOWN,
         )
         logging.info(
-            f"Traceroute configuration: interval={self._TRACEROUTE_INTERVAL}s, max_retries={self._MAX_RETRIES}, max_backoff={self._MAX_BACKOFF}s, max_threads={max_traceroute_threads}"
+            "Traceroute configuration: interval=%ss, max_retries=%s, max_backoff=%ss, max_threads=%s",
+            self._TRACEROUTE_INTERVAL,
+            self._MAX_RETRIES,
+            self._MAX_BACKOFF,
+            max_traceroute_threads,
         )
-        logging.info(f"Traceroute persistence: {self._persistence_file}")
+        logging.info("Traceroute persistence: %s", self._persistence_file)
 
     def _load_state(self) -> None:
         """
@@ -137,16 +174,22 @@ class TracerouteManager:
                         expired_nodes.append(node_id)
                         time_expired = now - backoff_until
                         logging.info(
-                            f"[Persistence] Node {node_id} backoff expired {time_expired / 60:.1f} minutes ago, cleaning up"
+                            "[Persistence] Node %s backoff expired %.1f minutes ago, cleaning up",
+                            node_id,
+                            time_expired / 60,
                         )
 
+                if expired_nodes:
+                    self._state_gen += 1
                 for node_id in expired_nodes:
                     del self._node_backoff_until[node_id]
                     # Also clear failure counts for expired backoffs
                     if node_id in self._node_failure_counts:
                         failure_count = self._node_failure_counts[node_id]
                         logging.info(
-                            f"[Persistence] Clearing {failure_count} failure count(s) for expired node {node_id}"
+                            "[Persistence] Clearing %s failure count(s) for expired node %s",
+                            failure_count,
+                            node_id,
                         )
                         del self._node_failure_counts[node_id]
 
@@ -158,21 +201,26 @@ class TracerouteManager:
                 )
 
                 logging.info(
-                    f"[Persistence] Loaded state for {total_nodes_with_state} nodes total:"
+                    "[Persistence] Loaded state for %s nodes total:",
+                    total_nodes_with_state,
                 )
                 logging.info(
-                    f"[Persistence] - {len(self._last_traceroute_time)} nodes with traceroute history"
+                    "[Persistence] - %s nodes with traceroute history",
+                    len(self._last_traceroute_time),
                 )
                 logging.info(
-                    f"[Persistence] - {len(self._node_failure_counts)} nodes with active failures"
+                    "[Persistence] - %s nodes with active failures",
+                    len(self._node_failure_counts),
                 )
                 logging.info(
-                    f"[Persistence] - {len(self._node_backoff_until)} nodes in backoff"
+                    "[Persistence] - %s nodes in backoff", len(self._node_backoff_until)
                 )
 
                 if expired_nodes:
                     logging.info(
-                        f"[Persistence] Cleaned up {len(expired_nodes)} expired backoffs: {', '.join(expired_nodes)}"
+                        "[Persistence] Cleaned up %s expired backoffs: %s",
+                        len(expired_nodes),
+                        ", ".join(expired_nodes),
                     )
 
                 # Log nodes with active failures and backoffs for debugging
@@ -182,7 +230,8 @@ class TracerouteManager:
                         for node_id, count in self._node_failure_counts.items()
                     ]
                     logging.info(
-                        f"[Persistence] Nodes with active failures: {', '.join(failure_details)}"
+                        "[Persistence] Nodes with active failures: %s",
+                        ", ".join(failure_details),
                     )
 
                 if self._node_backoff_until:
@@ -191,47 +240,92 @@ class TracerouteManager:
                         remaining_time = (backoff_until - now) / 60
                         backoff_details.append(f"{node_id}({remaining_time:.1f}m)")
                     logging.info(
-                        f"[Persistence] Nodes in backoff: {', '.join(backoff_details)}"
+                        "[Persistence] Nodes in backoff: %s", ", ".join(backoff_details)
                     )
             else:
                 logging.info(
-                    f"[Persistence] No existing state file found at {self._persistence_file}, starting fresh"
+                    "[Persistence] No existing state file found at %s, starting fresh",
+                    self._persistence_file,
                 )
         except Exception as e:
             logging.error(
-                f"[Persistence] Failed to load state from {self._persistence_file}: {e}, starting fresh"
+                "[Persistence] Failed to load state from %s: %s, starting fresh",
+                self._persistence_file,
+                e,
             )
             self._last_traceroute_time = {}
             self._node_failure_counts = {}
             self._node_backoff_until = {}
 
-    def _save_state(self) -> None:
+    def _save_state(self, fsync: bool = False) -> None:
         """
         Save current traceroute state to filesystem.
+
+        Args:
+            fsync: Flush the file to disk before replacing the old state.
+                Only used for the final checkpoint; routine saves rely on
+                OS write-back.
         """
         try:
             with self._persistence_lock:
-                # Prepare data to save
+                gen = self._state_gen
+                # A checkpoint still has to sync a write the flusher left
+                # to OS write-back
+                if gen == self._saved_gen and (not fsync or gen == self._synced_gen):
+                    return
+
+                # Prepare data to save. Copy the dicts, since other threads may
+                # update them while the flusher is serializing
                 data = {
-                    "last_traceroute_time": self._last_traceroute_time,
-                    "node_failure_counts": self._node_failure_counts,
-                    "node_backoff_until": self._node_backoff_until,
-                    "saved_at": time.time(),
+                    "last_traceroute_time": dict(self._last_traceroute_time),
+                    "node_failure_counts": dict(self._node_failure_counts),
+                    "node_backoff_until": dict(self._node_backoff_until),
                 }
 
                 # Write to temporary file first, then rename (atomic operation)
                 temp_file = f"{self._persistence_file}.tmp"
+                # Compact JSON in a single write; the file is only read back
+                # by _load_state()
+                payload = json.dumps(data, separators=(",", ":"))
                 with open(temp_file, "w") as f:
-                    json.dump(data, f, indent=2)
+                    f.write(payload)
+                    if fsync:
+                        f.flush()
+                        os.fsync(f.fileno())
 
                 # Atomic rename
-                os.rename(temp_file, self._persistence_file)
-                logging.debug(f"[Persistence] State saved to {self._persistence_file}")
+                os.replace(temp_file, self._persistence_file)
+                self._saved_gen = gen
+                if fsync:
+                    self._synced_gen = gen
+                logging.debug("[Persistence] State saved to %s", self._persistence_file)
         except Exception as e:
             logging.error(
-                f"[Persistence] Failed to save state to {self._persistence_file}: {e}"
+                "[Persistence] Failed to save state to %s: %s",
+                self._persistence_file,
+                e,
             )
 
+    def _mark_dirty(self) -> None:
+        """
+        Schedule a state save on the flusher thread.
+        """
+        self._state_gen += 1
+        self._state_dirty.set()
+
+    def _state_flusher(self) -> None:
+        """
+        Background thread that coalesces state changes into delayed saves.
+        """
+        while not self._shutdown_flag.is_set():
+            if not self._state_dirty.wait(timeout=1.0):
+                continue
+            # Let the rest of a burst land before writing
+            self._shutdown_flag.wait(timeout=_STATE_FLUSH_DELAY)
+            # Clear before saving so changes made during the save trigger another
+            self._state_dirty.clear()
+            self._save_state()
+
     def cleanup(self) -> None:
         """
         Cleanup resources and save final state.
@@ -256,11 +350,12 @@ class TracerouteManager:
                     for thread in self._traceroute_executor._threads:
                         if thread.is_alive():
                             logging.warning(
-                                f"[TracerouteManager] Force-stopping thread {thread.name}"
+                                "[TracerouteManager] Force-stopping thread %s",
+                                thread.name,
                             )
                             # Note: Python doesn't have thread.stop(), but we can try other approaches
             except Exception as e:
-                logging.debug(f"[TracerouteManager] Error during force shutdown: {e}")
+                logging.debug("[TracerouteManager] Error during force shutdown: %s", e)
 
             logging.info(
                 "[TracerouteManager] Traceroute thread pool shutdown initiated."
@@ -280,7 +375,12 @@ class TracerouteManager:
             else:
                 logging.info("[TracerouteManager] Worker thread finished cleanly")
 
-        self._save_state()
+        # The flusher exits on the shutdown flag; the final save below covers
+        # anything it had not written yet
+        if self._state_flusher_thread.is_alive():
+            self._state_flusher_thread.join(timeout=2.0)
+        self._state_dirty.clear()
+        self._save_state(fsync=True)
 
     def _calculate_backoff_time(self, failure_count: int) -> int:
         """
@@ -303,21 +403,24 @@ class TracerouteManager:
         )
         return backoff_time
 
-    def _is_node_in_backoff(self, node_id: str) -> bool:
+    def _is_node_in_backoff(self, node_id: str, now: float | None = None) -> bool:
         """
         Check if a node is currently in backoff period.
 
         Args:
             node_id (str): The node ID to check
+            now (float): Current time.time() if the caller already has it
 
         Returns:
             bool: True if node is in backoff, False otherwise
         """
-        if node_id not in self._node_backoff_until:
+        backoff_until = self._node_backoff_until.get(node_id)
+        if backoff_until is None:
             return False
 
-        now = time.time()
-        return now < self._node_backoff_until[node_id]
+        if now is None:
+            now = time.time()
+        return now < backoff_until
 
     def record_traceroute_success(self, node_id: str) -> None:
         """
@@ -333,17 +436,19 @@ class TracerouteManager:
         if node_id in self._node_failure_counts:
             failure_count = self._node_failure_counts[node_id]
             logging.info(
-                f"[Traceroute] Node {node_id} traceroute succeeded after {failure_count} failures, resetting backoff."
+                "[Traceroute] Node %s traceroute succeeded after %s failures, resetting backoff.",
+                node_id,
+                failure_count,
             )
             del self._node_failure_counts[node_id]
         else:
             # Log success for nodes without previous failures
-            logging.info(f"[Traceroute] Node {node_id} traceroute succeeded.")
+            logging.info("[Traceroute] Node %s traceroute succeeded.", node_id)
 
         if node_id in self._node_backoff_until:
             del self._node_backoff_until[node_id]
 
-        self._save_state()
+        self._mark_dirty()
 
     def _record_traceroute_failure(self, node_id: str) -> bool:
         """
@@ -361,25 +466,32 @@ class TracerouteManager:
 
         if failure_count >= self._MAX_RETRIES:
             logging.warning(
-                f"[Traceroute] Node {node_id} has failed {failure_count} times, giving up."
+                "[Traceroute] Node %s has failed %s times, giving up.",
+                node_id,
+                failure_count,
             )
             # Save state after updating failure count
-            self._save_state()
+            self._mark_dirty()
             return False
 
         backoff_time = self._calculate_backoff_time(failure_count)
         if backoff_time > 0:
             self._node_backoff_until[node_id] = time.time() + backoff_time
             logging.info(
-                f"[Traceroute] Node {node_id} failed {failure_count} times, backing off for {backoff_time / 60:.1f} minutes."
+                "[Traceroute] Node %s failed %s times, backing off for %.1f minutes.",
+                node_id,
+                failure_count,
+                backoff_time / 60,
             )
         else:
             logging.info(
-                f"[Traceroute] Node {node_id} failed {failure_count} times, no backoff applied yet."
+                "[Traceroute] Node %s failed %s times, no backoff applied yet.",
+                node_id,
+                failure_count,
             )
 
         # Save state after updating failure and backoff data
-        self._save_state()
+        self._mark_dirty()
         return True
 
     def _format_position(self, pos: tuple[float, float, float | None] | None) -> str:
@@ -413,7 +525,7 @@ class TracerouteManager:
         # Early exit if shutdown is requested
         if self._shutdown_flag.is_set():
             logging.info(
-                f"[Traceroute] Shutdown requested, skipping traceroute for {node_id}"
+                "[Traceroute] Shutdown requested, skipping traceroute for %s", node_id
             )
             return False
 
@@ -424,31 +536,37 @@ class TracerouteManager:
         failure_count = self._node_failure_counts.get(node_id, 0)
 
         logging.info(
-            f"[Traceroute] Running traceroute for Node {node_id} | Long name: {long_name if long_name else 'UNKNOWN'} | Position: {self._format_position(pos)} | Failures: {failure_count}"
+            "[Traceroute] Running traceroute for Node %s | Long name: %s | Position: %s | Failures: %s",
+            node_id,
+            long_name if long_name else "UNKNOWN",
+            self._format_position(pos),
+            failure_count,
         )
 
         try:
             # Check shutdown flag before expensive operations
             if self._shutdown_flag.is_set():
                 logging.info(
-                    f"[Traceroute] Shutdown requested during setup, aborting traceroute for {node_id}"
+                    "[Traceroute] Shutdown requested during setup, aborting traceroute for %s",
+                    node_id,
                 )
                 return False
 
             # Log node info before traceroute
             try:
                 info = self.interface.getMyNodeInfo()
-                logging.debug(f"[Traceroute] Node info before traceroute: {info}")
+                logging.debug("[Traceroute] Node info before traceroute: %s", info)
             except Exception as e:
                 logging.error(
-                    f"[Traceroute] Failed to get node info before traceroute: {e}"
+                    "[Traceroute] Failed to get node info before traceroute: %s", e
                 )
 
             # Update global traceroute time before attempting
-            self._last_global_traceroute_time = time.time()
+            self._last_global_traceroute_time = time.monotonic()
 
             logging.debug(
-                f"[Traceroute] About to send traceroute to {node_id} and setting last traceroute time."
+                "[Traceroute] About to send traceroute to %s and setting last traceroute time.",
+                node_id,
             )
 
             try:
@@ -456,7 +574,7 @@ class TracerouteManager:
                 if self._shutdown_flag.is_set():
                     timeout_seconds = 2  # Very short timeout if shutting down
                 else:
-                    timeout_seconds = int(os.getenv("TRACEROUTE_SEND_TIMEOUT", 30))
+                    timeout_seconds = self._SEND_TIMEOUT
 
                 # Submit traceroute to thread pool and wait with timeout
                 future = self._traceroute_executor.submit(
@@ -469,14 +587,16 @@ class TracerouteManager:
                     # Wait for completion with timeout
                     future.result(timeout=timeout_seconds)
                     logging.info(
-                        f"[Traceroute] Traceroute command sent for node {node_id}."
+                        "[Traceroute] Traceroute command sent for node %s.", node_id
                     )
                     # Note: Success will be recorded when we receive the TRACEROUTE_APP response packet
                     return True
 
                 except FutureTimeoutError:
                     logging.error(
-                        f"[Traceroute] Traceroute to node {node_id} timed out after {timeout_seconds} seconds"
+                        "[Traceroute] Traceroute to node %s timed out after %s seconds",
+                        node_id,
+                        timeout_seconds,
                     )
                     # Cancel the future to prevent resource leaks
                     future.cancel()
@@ -485,14 +605,16 @@ class TracerouteManager:
 
                 except Exception as e:
                     logging.error(
-                        f"[Traceroute] Error in traceroute execution for node {node_id}: {e}"
+                        "[Traceroute] Error in traceroute execution for node %s: %s",
+                        node_id,
+                        e,
                     )
                     self._record_traceroute_failure(node_id)
                     return False
 
             except Exception as e:
                 logging.error(
-                    f"[Traceroute] Error sending traceroute to node {node_id}: {e}"
+                    "[Traceroute] Error sending traceroute to node %s: %s", node_id, e
                 )
                 # Record failure and check if we should continue retrying
                 self._record_traceroute_failure(node_id)
@@ -500,18 +622,51 @@ class TracerouteManager:
 
         except Exception as e:
             logging.error(
-                f"[Traceroute] Unexpected error sending traceroute to node {node_id}: {e}"
+                "[Traceroute] Unexpected error sending traceroute to node %s: %s",
+                node_id,
+                e,
             )
             # Record failure for unexpected errors too
             self._record_traceroute_failure(node_id)
             return False
 
+    def _schedule_retry(self, node_id: str, retries: int, ready_at: float) -> None:
+        """
+        Hold a job back until ready_at (a time.time() value).
+
+        Args:
+            node_id (str): The node ID to traceroute
+            retries (int): Retries already made for this job
+            ready_at (float): When the job may be queued again
+        """
+        with self._retry_lock:
+            if node_id in self._retry_scheduled:
+                return
+            self._retry_scheduled.add(node_id)
+            heapq.heappush(self._retry_heap, (ready_at, node_id, retries))
+
+    def _release_due_retries(self, now: float) -> None:
+        """
+        Move scheduled jobs that are due into the traceroute queue.
+
+        Args:
+            now (float): Current time.time()
+        """
+        with self._retry_lock:
+            while self._retry_heap and self._retry_heap[0][0] <= now:
+                _, node_id, retries = heapq.heappop(self._retry_heap)
+                self._retry_scheduled.discard(node_id)
+                self._traceroute_queue.put((node_id, retries))
+
     def _traceroute_worker(self) -> None:
         """
         Worker thread that processes traceroute jobs from the queue.
         """
         while not self._shutdown_flag.is_set():
             try:
+                # Queue any held-back jobs whose backoff has ended
+                self._release_due_retries(time.time())
+
                 # Get the next job from the queue with timeout to check shutdown flag
                 try:
                     node_id, retries = self._traceroute_queue.get(timeout=1.0)
@@ -520,11 +675,15 @@ class TracerouteManager:
                     continue
 
                 logging.info(
-                    f"[Traceroute] Worker picked up job for node {node_id}, attempt {retries + 1}."
-                )
-                logging.info(
-                    f"[Traceroute] Current queue depth: {self._traceroute_queue.qsize()}"
+                    "[Traceroute] Worker picked up job for node %s, attempt %s.",
+                    node_id,
+                    retries + 1,
                 )
+                if logging.getLogger().isEnabledFor(logging.DEBUG):
+                    logging.debug(
+                        "[Traceroute] Current queue depth: %s",
+                        self._traceroute_queue.qsize(),
+                    )
 
                 # Check shutdown flag before processing
                 if self._shutdown_flag.is_set():
@@ -534,28 +693,29 @@ class TracerouteManager:
                     break
 
                 # Check if this node is in backoff period
-                if self._is_node_in_backoff(node_id):
-                    backoff_remaining = self._node_backoff_until[node_id] - time.time()
+                wall_now = time.time()
+                if self._is_node_in_backoff(node_id, wall_now):
+                    backoff_remaining = self._node_backoff_until[node_id] - wall_now
                     logging.info(
-                        f"[Traceroute] Node {node_id} is in backoff for {backoff_remaining / 60:.1f} more minutes, re-queueing for later."
+                        "[Traceroute] Node %s is in backoff for %.1f more minutes, scheduling for later.",
+                        node_id,
+                        backoff_remaining / 60,
+                    )
+                    self._schedule_retry(
+                        node_id, retries, self._node_backoff_until[node_id]
                     )
-
-                    # Re-queue the job for later processing if not shutting down
-                    if not self._shutdown_flag.is_set():
-                        self._traceroute_queue.put((node_id, retries))
-
-                    # Add a small delay to prevent busy loop when all nodes are in backoff
-                    self._shutdown_flag.wait(timeout=5.0)  # Interruptible sleep
                     continue
 
                 # Check global cooldown before processing
-                now = time.time()
+                now = time.monotonic()
                 time_since_last = now - self._last_global_traceroute_time
 
                 if time_since_last < self._TRACEROUTE_COOLDOWN:
                     wait_time = self._TRACEROUTE_COOLDOWN - time_since_last
                     logging.info(
-                        f"[Traceroute] Global cooldown active, sleeping {wait_time:.1f} seconds before processing node {node_id}"
+                        "[Traceroute] Global cooldown active, sleeping %.1f seconds before processing node %s",
+                        wait_time,
+                        node_id,
                     )
 
                     # Sleep in small increments to remain responsive to shutdown signal
@@ -569,7 +729,7 @@ class TracerouteManager:
                         wait_time -= sleep_duration
 
                         # Re-check if we still need to wait (in case another traceroute completed)
-                        current_time = time.time()
+                        current_time = time.monotonic()
                         remaining_cooldown = self._TRACEROUTE_COOLDOWN - (
                             current_time - self._last_global_traceroute_time
                         )
@@ -589,7 +749,10 @@ class TracerouteManager:
 
                 if not success:
                     logging.error(
-                        f"[Traceroute] Failed to traceroute node {node_id} after {retries + 1} attempts. Total failures: {failure_count}"
+                        "[Traceroute] Failed to traceroute node %s after %s attempts. Total failures: %s",
+                        node_id,
+                        retries + 1,
+                        failure_count,
                     )
 
                     # Check if we should retry this node (based on failure count and max retries)
@@ -600,25 +763,32 @@ class TracerouteManager:
                         # Re-queue with incremented retry count if we haven't hit max retries
                         new_retries = retries + 1
                         logging.info(
-                            f"[Traceroute] Re-queueing node {node_id} for retry {new_retries + 1}/{self._MAX_RETRIES}"
+                            "[Traceroute] Re-queueing node %s for retry %s/%s",
+                            node_id,
+                            new_retries + 1,
+                            self._MAX_RETRIES,
                         )
                         self._traceroute_queue.put((node_id, new_retries))
                     else:
                         if self._shutdown_flag.is_set():
                             logging.info(
-                                f"[Traceroute] Shutdown signal received, not re-queueing node {node_id}"
+                                "[Traceroute] Shutdown signal received, not re-queueing node %s",
+                                node_id,
                             )
                         else:
                             logging.warning(
-                                f"[Traceroute] Node {node_id} has reached maximum retry limit ({self._MAX_RETRIES}), giving up."
+                                "[Traceroute] Node %s has reached maximum retry limit (%s), giving up.",
+                                node_id,
+                                self._MAX_RETRIES,
                             )
                 else:
                     logging.info(
-                        f"[Traceroute] Traceroute for node {node_id} completed successfully."
+                        "[Traceroute] Traceroute for node %s completed successfully.",
+                        node_id,
                     )
 
             except Exception as e:
-                logging.error(f"[Traceroute] Worker encountered error: {e}")
+                logging.error("[Traceroute] Worker encountered error: %s", e)
 
         logging.info("[Traceroute] Worker thread exiting cleanly")
 
@@ -632,39 +802,48 @@ class TracerouteManager:
             is_new_node (bool): Whether this is a new node (from NodeCache)
         """
         node_id = str(node_id)  # Ensure node_id is always a string
+        # One clock read serves every check below
+        now = time.time()
 
         # Enqueue traceroute for new nodes
         if is_new_node:
-            if self._is_node_in_backoff(node_id):
-                backoff_remaining = self._node_backoff_until[node_id] - time.time()
+            if self._is_node_in_backoff(node_id, now):
+                backoff_remaining = self._node_backoff_until[node_id] - now
                 logging.debug(
-                    f"[Traceroute] New node {node_id} is in backoff for {backoff_remaining / 60:.1f} more minutes, skipping."
+                    "[Traceroute] New node %s is in backoff for %.1f more minutes, skipping.",
+                    node_id,
+                    backoff_remaining / 60,
                 )
             elif self._traceroute_queue.put((node_id, 0)):  # 0 retries so far
                 logging.info(
-                    f"[Traceroute] New node discovered: {node_id}, enqueued traceroute job."
+                    "[Traceroute] New node discovered: %s, enqueued traceroute job.",
+                    node_id,
                 )
             else:
                 logging.debug(
-                    f"[Traceroute] New node {node_id} already queued, skipping duplicate."
+                    "[Traceroute] New node %s already queued or queue full, skipping.",
+                    node_id,
                 )
 
         # Periodic re-traceroute
-        now = time.time()
         last_time = self._last_traceroute_time.get(node_id, 0)
         if now - last_time > self._TRACEROUTE_INTERVAL:
-            if self._is_node_in_backoff(node_id):
-                backoff_remaining = self._node_backoff_until[node_id] - time.time()
+            if self._is_node_in_backoff(node_id, now):
+                backoff_remaining = self._node_backoff_until[node_id] - now
                 logging.debug(
-                    f"[Traceroute] Periodic traceroute for node {node_id} is in backoff for {backoff_remaining / 60:.1f} more minutes, skipping."
+                    "[Traceroute] Periodic traceroute for node %s is in backoff for %.1f more minutes, skipping.",
+                    node_id,
+                    backoff_remaining / 60,
                 )
             elif self._traceroute_queue.put((node_id, 0)):  # 0 retries so far
                 logging.info(
-                    f"[Traceroute] Periodic traceroute needed for node {node_id}, enqueued job."
+                    "[Traceroute] Periodic traceroute needed for node %s, enqueued job.",
+                    node_id,
                 )
             else:
                 logging.debug(
-                    f"[Traceroute] Periodic traceroute for node {node_id} already queued, skipping duplicate."
+                    "[Traceroute] Periodic traceroute for node %s already queued or queue full, skipping.",
+                    node_id,
                 )
 
     def queue_traceroute(self, node_id: str) -> bool:
@@ -675,22 +854,26 @@ class TracerouteManager:
             node_id (str): The node ID to queue for traceroute
 
         Returns:
-            bool: True if queued successfully, False if already queued or in backoff
+            bool: True if queued successfully, False if already queued, queue full or in backoff
         """
         node_id = str(node_id)
 
-        if self._is_node_in_backoff(node_id):
-            backoff_remaining = self._node_backoff_until[node_id] - time.time()
+        now = time.time()
+        if self._is_node_in_backoff(node_id, now):
+            backoff_remaining = self._node_backoff_until[node_id] - now
             logging.debug(
-                f"[Traceroute] Manual traceroute for node {node_id} is in backoff for {backoff_remaining / 60:.1f} more minutes, skipping."
+                "[Traceroute] Manual traceroute for node %s is in backoff for %.1f more minutes, skipping.",
+                node_id,
+                backoff_remaining / 60,
             )
             return False
 
         if self._traceroute_queue.put((node_id, 0)):  # 0 retries so far
-            logging.info(f"[Traceroute] Manual traceroute queued for node {node_id}.")
+            logging.info("[Traceroute] Manual traceroute queued for node %s.", node_id)
             return True
         else:
             logging.debug(
-                f"[Traceroute] Manual traceroute for node {node_id} already queued, skipping duplicate."
+                "[Traceroute] Manual traceroute for node %s already queued or queue full, skipping.",
+                node_id,
             )
             return False
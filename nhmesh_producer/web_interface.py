@@ -8,7 +8,7 @@ import time
 from datetime import datetime
 from typing import Any
 
-from flask import Flask, jsonify, render_template_string
+from flask import Flask, jsonify, make_response, request
 
 # Simple HTML template for the dashboard
 DASHBOARD_TEMPLATE = """
@@ -160,7 +160,11 @@ class WebInterface:
         self.host = host
         self.port = port
         self.app = Flask(__name__)
-        self.start_time = time.time()
+        # Parse the dashboard once; render_template_string() recompiles it
+        # on every request
+        self._dashboard_template = self.app.jinja_env.from_string(DASHBOARD_TEMPLATE)
+        # Uptime is an interval, so measure it on the monotonic clock
+        self.start_time = time.monotonic()
         self.packets_published = 0
         self.last_packet_time: float | None = None
         self.server_thread: threading.Thread | None = None
@@ -190,7 +194,7 @@ class WebInterface:
                 status_class = "disconnected"
 
             # Calculate uptime
-            uptime_seconds = int(time.time() - self.start_time)
+            uptime_seconds = int(time.monotonic() - self.start_time)
             uptime_hours = uptime_seconds // 3600
             uptime_minutes = (uptime_seconds % 3600) // 60
             uptime_str = f"{uptime_hours}h {uptime_minutes}m"
@@ -205,8 +209,7 @@ class WebInterface:
 
             connection_info = self.handler.connection_manager.get_connection_info()
 
-            return render_template_string(
-                DASHBOARD_TEMPLATE,
+            html = self._dashboard_template.render(
                 status_text=status_text,
                 status_class=status_class,
                 meshtastic_status="Connected" if meshtastic_connected else "Disconnected",
@@ -220,6 +223,11 @@ class WebInterface:
                 connection_errors=connection_info.get("connection_errors", 0),
             )
 
+            # Repeat loads between counter ticks get an empty 304
+            response = make_response(html)
+            response.add_etag()
+            return response.make_conditional(request)
+
         @self.app.route("/api/stats")
         def stats():
             """Stats API endpoint for health checks"""
@@ -231,7 +239,7 @@ class WebInterface:
                     "status": "healthy"
                     if health_status.get("connected")
                     else "unhealthy",
-                    "uptime_seconds": int(time.time() - self.start_time),
+                    "uptime_seconds": int(time.monotonic() - self.start_time),
                     "meshtastic": {
                         "connected": health_status.get("connected", False),
                         "connection_type": connection_info.get("connection_type"),
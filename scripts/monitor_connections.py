@@ -31,9 +31,10 @@ def get_tcp_connections(host: str, port: int = 4403) -> list[dict[str, Any]]:
             ["netstat", "-an"], capture_output=True, text=True, timeout=10
         )
 
+        needle = f"{host}:{port}"
         connections = []
-        for line in result.stdout.split("\n"):
-            if f"{host}:{port}" in line and "ESTABLISHED" in line:
+        for line in result.stdout.splitlines():
+            if "ESTABLISHED" in line and needle in line:
                 parts = line.split()
                 if len(parts) >= 4:
                     connections.append(
@@ -40,7 +40,7 @@ class MQTTListenerTester:
 
     def setup_mqtt_client(self) -> None:
         """Setup MQTT client for testing"""
-        self.mqtt_client = mqtt.Client()
+        self.mqtt_client = mqtt.Client(mqtt.CallbackAPIVersion.VERSION2)
         self.mqtt_client.on_connect = self._on_connect
         self.mqtt_client.on_publish = self._on_publish
 
@@ -53,14 +53,18 @@ class MQTTListenerTester:
             logging.error(f"Failed to setup MQTT client: {e}")
             raise
 
-    def _on_connect(self, client: Any, userdata: Any, flags: Any, rc: int) -> None:
+    def _on_connect(
+        self, client: Any, userdata: Any, flags: Any, reason_code: Any, properties: Any
+    ) -> None:
         """MQTT connection callback"""
-        if rc == 0:
+        if not reason_code.is_failure:
             logging.info("MQTT client connected successfully")
         else:
-            logging.error(f"MQTT client connection failed: {rc}")
+            logging.error(f"MQTT client connection failed: {reason_code}")
 
-    def _on_publish(self, client: Any, userdata: Any, mid: int) -> None:
+    def _on_publish(
+        self, client: Any, userdata: Any, mid: int, reason_code: Any, properties: Any
+    ) -> None:
         """MQTT publish callback"""
         logging.info(f"Test message published with ID: {mid}")
 
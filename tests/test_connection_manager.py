@@ -0,0 +1,309 @@
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from nhmesh_producer.utils.connection_manager import ConnectionManager, _TCPInterface
+
+
+class TestConnectionErrors(unittest.TestCase):
+    def setUp(self):
+        self.manager = ConnectionManager(node_ip="1.2.3.4", reconnect_delay=0)
+        # Keep error paths from kicking off real reconnection attempts
+        self.manager.stop_event.set()
+
+    def test_connection_errors_capped(self):
+        self.manager.external_error_debounce = 0
+        for _ in range(self.manager.max_connection_errors * 3):
+            self.manager.handle_external_error("Connection refused")
+            self.assertLessEqual(
+                self.manager.connection_errors, self.manager.max_connection_errors
+            )
+        self.assertEqual(
+            self.manager.connection_errors, self.manager.max_connection_errors
+        )
+
+    def test_failed_connect_respects_cap(self):
+        self.manager.connection_errors = self.manager.max_connection_errors
+        with patch(
+            "nhmesh_producer.utils.connection_manager.meshtastic.tcp_interface.TCPInterface",
+            side_effect=Exception("unexpected failure"),
+        ):
+            self.assertFalse(self.manager.connect())
+        self.assertEqual(
+            self.manager.connection_errors, self.manager.max_connection_errors
+        )
+
+    def test_concurrent_bumps_not_lost(self):
+        self.manager.max_connection_errors = 8 * 1000
+
+        def bump():
+            for _ in range(1000):
+                with self.manager.lock:
+                    self.manager._bump_errors()
+
+        threads = [threading.Thread(target=bump) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(self.manager.connection_errors, 8 * 1000)
+
+    def test_reconnect_resets_errors(self):
+        self.manager.connection_errors = self.manager.max_connection_errors
+        self.manager.reconnect()
+        self.assertEqual(self.manager.connection_errors, 0)
+
+    def test_external_error_burst_coalesced(self):
+        for _ in range(5):
+            self.manager.handle_external_error("Connection reset")
+        self.assertEqual(self.manager.connection_errors, 1)
+
+
+class TestValidation(unittest.TestCase):
+    def test_rejects_non_positive_intervals(self):
+        with self.assertRaises(ValueError):
+            ConnectionManager(node_ip="1.2.3.4", health_check_interval=0)
+        with self.assertRaises(ValueError):
+            ConnectionManager(node_ip="1.2.3.4", packet_timeout=-1)
+
+    def test_rejects_delay_above_cap(self):
+        with self.assertRaises(ValueError):
+            ConnectionManager(
+                node_ip="1.2.3.4", reconnect_delay=120, reconnect_delay_max=60
+            )
+
+
+class TestReconnectBackoff(unittest.TestCase):
+    def test_backoff_capped_without_jitter(self):
+        manager = ConnectionManager(
+            node_ip="1.2.3.4",
+            reconnect_delay=5,
+            reconnect_delay_max=60,
+            reconnect_jitter=False,
+        )
+        delays = [manager._backoff_delay(n) for n in range(1, 8)]
+        self.assertEqual(delays, [5, 10, 20, 40, 60, 60, 60])
+
+    def test_backoff_jitter_within_bounds(self):
+        manager = ConnectionManager(
+            node_ip="1.2.3.4", reconnect_delay=5, reconnect_delay_max=60
+        )
+        for n in range(1, 12):
+            cap = min(60, 5 * 2 ** (n - 1))
+            delay = manager._backoff_delay(n)
+            self.assertGreaterEqual(delay, cap * 0.5)
+            self.assertLessEqual(delay, cap)
+
+    def test_negative_attempts_retry_until_success(self):
+        manager = ConnectionManager(
+            node_ip="1.2.3.4", reconnect_attempts=-1, reconnect_delay=0
+        )
+        outcomes = iter([False] * 12 + [True])
+        with patch.object(manager, "connect", side_effect=lambda: next(outcomes)):
+            self.assertTrue(manager.reconnect())
+        self.assertEqual(manager._retries_since_last_success, 12)
+
+    def test_unlimited_reconnect_runs_off_caller_thread(self):
+        manager = ConnectionManager(
+            node_ip="1.2.3.4", reconnect_attempts=-1, reconnect_delay=0
+        )
+        started = threading.Event()
+        callers = []
+
+        def fake_connect():
+            callers.append(threading.current_thread())
+            started.set()
+            manager.stop_event.wait(timeout=0.05)
+            return False
+
+        with patch.object(manager, "connect", side_effect=fake_connect):
+            begin = time.monotonic()
+            self.assertIsNone(manager.get_interface())
+            self.assertLess(time.monotonic() - begin, 1)
+            self.assertTrue(started.wait(timeout=5))
+            # A reconnect is now in flight; later callers return promptly too
+            begin = time.monotonic()
+            self.assertIsNone(manager.get_interface())
+            self.assertLess(time.monotonic() - begin, 1)
+            manager.close()
+        self.assertNotIn(threading.current_thread(), callers)
+
+
+class TestConcurrentReconnect(unittest.TestCase):
+    def test_concurrent_callers_share_one_attempt(self):
+        manager = ConnectionManager(node_ip="1.2.3.4")
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def fake_connect():
+            calls.append(1)
+            started.set()
+            release.wait(timeout=5)
+            manager.interface = object()
+            manager.connected = True
+            return True
+
+        results = []
+        with patch.object(manager, "connect", side_effect=fake_connect):
+            first = threading.Thread(target=lambda: results.append(manager.reconnect()))
+            first.start()
+            started.wait(timeout=5)
+            second = threading.Thread(
+                target=lambda: results.append(manager.reconnect())
+            )
+            second.start()
+            # Let the second caller reach the in-progress check first
+            time.sleep(0.2)
+            release.set()
+            first.join()
+            second.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [True, True])
+
+    def test_get_interface_returns_while_connect_blocked(self):
+        manager = ConnectionManager(node_ip="1.2.3.4", reconnect_delay=0)
+        started = threading.Event()
+        release = threading.Event()
+        callers = []
+
+        def fake_connect():
+            callers.append(threading.current_thread())
+            started.set()
+            release.wait(timeout=5)
+            return False
+
+        with patch.object(manager, "connect", side_effect=fake_connect):
+            begin = time.monotonic()
+            self.assertIsNone(manager.get_interface())
+            self.assertTrue(started.wait(timeout=5))
+            self.assertIsNone(manager.get_interface())
+            self.assertLess(time.monotonic() - begin, 1)
+            manager.stop_event.set()
+            release.set()
+            manager.close()
+        self.assertNotIn(threading.current_thread(), callers)
+
+    def test_get_interface_does_not_wait_for_reconnect(self):
+        manager = ConnectionManager(node_ip="1.2.3.4")
+        started = threading.Event()
+        release = threading.Event()
+
+        def fake_connect():
+            started.set()
+            release.wait(timeout=5)
+            return False
+
+        with patch.object(manager, "connect", side_effect=fake_connect):
+            worker = threading.Thread(target=manager.reconnect)
+            worker.start()
+            started.wait(timeout=5)
+            begin = time.monotonic()
+            self.assertIsNone(manager.get_interface())
+            self.assertLess(time.monotonic() - begin, 1)
+            manager.stop_event.set()
+            release.set()
+            worker.join()
+
+
+class TestNodeId(unittest.TestCase):
+    def test_node_id_from_my_node_num(self):
+        interface = MagicMock()
+        interface.myInfo.my_node_num = 0x1A2B3C
+        self.assertEqual(ConnectionManager._read_node_id(interface), "!001a2b3c")
+        interface.getMyNodeInfo.assert_not_called()
+
+    def test_node_id_falls_back_to_node_info(self):
+        interface = MagicMock()
+        interface.myInfo = None
+        interface.getMyNodeInfo.return_value = {"user": {"id": "!deadbeef"}}
+        self.assertEqual(ConnectionManager._read_node_id(interface), "!deadbeef")
+
+
+class TestMonotonicClock(unittest.TestCase):
+    def test_wall_clock_jump_does_not_expire_timeouts(self):
+        manager = ConnectionManager(node_ip="1.2.3.4", packet_timeout=60)
+        manager.packet_received()
+        with patch("time.time", return_value=time.time() + 86400):
+            self.assertFalse(manager.is_packet_timeout_expired())
+            status = manager.get_health_status()
+        self.assertLess(status["time_since_last_packet"], 60)
+        self.assertLess(status["time_since_last_heartbeat"], 60)
+
+
+class TestTcpDial(unittest.TestCase):
+    def test_every_dial_is_bounded_and_tuned(self):
+        sock = MagicMock()
+        with patch(
+            "nhmesh_producer.utils.connection_manager.socket.create_connection",
+            return_value=sock,
+        ) as dial:
+            interface = _TCPInterface("1.2.3.4", connect_timeout=7, connectNow=False)
+            # meshtastic's own redial after a dropped link goes through here
+            interface.myConnect()
+        dial.assert_called_once_with(("1.2.3.4", interface.portNumber), timeout=7)
+        sock.settimeout.assert_called_once_with(None)
+        sock.setsockopt.assert_called()
+        self.assertIs(interface.socket, sock)
+
+
+class TestHealthProbe(unittest.TestCase):
+    def test_stuck_probe_runs_on_daemon_thread(self):
+        manager = ConnectionManager(node_ip="1.2.3.4")
+        release = threading.Event()
+        probe_threads = []
+
+        def stuck_probe(interface, result, deep):
+            probe_threads.append(threading.current_thread())
+            release.wait(timeout=5)
+
+        with patch(
+            "nhmesh_producer.utils.connection_manager._do_health_check",
+            side_effect=stuck_probe,
+        ):
+            with self.assertRaises(TimeoutError):
+                manager._run_probe(MagicMock(), True, 0.1)
+            # The stuck worker is replaced rather than queued behind
+            with self.assertRaises(TimeoutError):
+                manager._run_probe(MagicMock(), True, 0.1)
+            release.set()
+            manager.close()
+
+        self.assertEqual(len(probe_threads), 2)
+        self.assertNotEqual(probe_threads[0], probe_threads[1])
+        self.assertTrue(all(t.daemon for t in probe_threads))
+
+
+class TestClose(unittest.TestCase):
+    def test_close_before_connecting(self):
+        with ConnectionManager(node_ip="1.2.3.4") as manager:
+            self.assertIsNone(manager.health_thread)
+        self.assertTrue(manager.stop_event.is_set())
+        self.assertFalse(manager.connect())
+
+    def test_close_is_idempotent(self):
+        manager = ConnectionManager(node_ip="1.2.3.4")
+        manager.close()
+        manager.close()
+        with ConnectionManager(node_ip="1.2.3.4") as manager:
+            manager.close()
+
+    def test_close_does_not_hang_on_stuck_interface_close(self):
+        manager = ConnectionManager(node_ip="1.2.3.4")
+        release = threading.Event()
+        interface = MagicMock()
+        interface.socket = None
+        interface.close.side_effect = lambda: release.wait(timeout=5)
+        manager.interface = interface
+        with patch("nhmesh_producer.utils.connection_manager._CLOSE_TIMEOUT", 0.2):
+            begin = time.monotonic()
+            manager.close()
+        self.assertLess(time.monotonic() - begin, 2)
+        interface.close.assert_called_once()
+        release.set()
+
+
+if __name__ == "__main__":
+    unittest.main()
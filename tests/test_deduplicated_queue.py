@@ -0,0 +1,46 @@
+import unittest
+
+from nhmesh_producer.utils.deduplicated_queue import DeduplicatedQueue
+
+
+class TestDeduplicatedQueue(unittest.TestCase):
+    def test_duplicate_keys_rejected_until_dequeued(self):
+        q = DeduplicatedQueue(key_func=lambda x: x[0])
+        self.assertTrue(q.put(("a", 0)))
+        self.assertFalse(q.put(("a", 1)))
+        self.assertEqual(q.get(), ("a", 0))
+        self.assertTrue(q.put(("a", 2)))
+
+    def test_drop_new_when_full(self):
+        q = DeduplicatedQueue(maxsize=2)
+        self.assertTrue(q.put(1))
+        self.assertTrue(q.put(2))
+        self.assertFalse(q.put(3))
+        self.assertEqual([q.get(), q.get()], [1, 2])
+        self.assertTrue(q.empty())
+
+    def test_drop_oldest_when_full(self):
+        q = DeduplicatedQueue(maxsize=2, overflow="drop_oldest")
+        for item in (1, 2, 3):
+            self.assertTrue(q.put(item))
+        self.assertEqual(q.qsize(), 2)
+        self.assertEqual([q.get(), q.get()], [2, 3])
+        # The evicted item's key is free again
+        self.assertTrue(q.put(1))
+
+    def test_get_batch_drains_available_items(self):
+        q = DeduplicatedQueue()
+        for item in range(5):
+            q.put(item)
+        self.assertEqual(q.get_batch(max_items=3), [0, 1, 2])
+        self.assertEqual(q.get_batch(max_items=3), [3, 4])
+        # Drained keys can be queued again
+        self.assertTrue(q.put(0))
+
+    def test_invalid_overflow_policy(self):
+        with self.assertRaises(ValueError):
+            DeduplicatedQueue(overflow="block")  # type: ignore[arg-type]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -21,15 +21,19 @@ logging.basicConfig(
 )
 
 
-def on_connect(client: Any, userdata: Any, flags: Any, rc: int) -> None:
+def on_connect(
+    client: Any, userdata: Any, flags: Any, reason_code: Any, properties: Any
+) -> None:
     """Callback for MQTT connection"""
-    if rc == 0:
+    if not reason_code.is_failure:
         logging.info("Connected to MQTT broker")
     else:
-        logging.error(f"Failed to connect to MQTT broker: {rc}")
+        logging.error(f"Failed to connect to MQTT broker: {reason_code}")
 
 
-def on_publish(client: Any, userdata: Any, mid: int) -> None:
+def on_publish(
+    client: Any, userdata: Any, mid: int, reason_code: Any, properties: Any
+) -> None:
     """Callback for MQTT publish"""
     logging.info(f"Message published with ID: {mid}")
 
@@ -45,7 +49,7 @@ def main():
     password = None  # Set if authentication is required
 
     # Create MQTT client
-    client = mqtt.Client()
+    client = mqtt.Client(mqtt.CallbackAPIVersion.VERSION2)
     client.on_connect = on_connect
     client.on_publish = on_publish
 
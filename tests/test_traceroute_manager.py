@@ -0,0 +1,100 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from nhmesh_producer.utils import traceroute_manager
+from nhmesh_producer.utils.traceroute_manager import TracerouteManager
+
+
+class TestStatePersistence(unittest.TestCase):
+    def setUp(self):
+        fd, self.state_file = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        os.unlink(self.state_file)
+        self.manager = TracerouteManager(
+            interface=MagicMock(),
+            node_cache=MagicMock(),
+            traceroute_persistence_file=self.state_file,
+        )
+
+    def tearDown(self):
+        self.manager.cleanup()
+        if os.path.exists(self.state_file):
+            os.unlink(self.state_file)
+
+    def test_burst_of_updates_saved_once(self):
+        with (
+            patch.object(traceroute_manager, "_STATE_FLUSH_DELAY", 0.1),
+            patch.object(
+                self.manager, "_save_state", wraps=self.manager._save_state
+            ) as save,
+        ):
+            for n in range(20):
+                self.manager.record_traceroute_success(f"!{n:08x}")
+            deadline = time.monotonic() + 5
+            while save.call_count == 0 and time.monotonic() < deadline:
+                time.sleep(0.05)
+            time.sleep(0.3)
+            self.assertEqual(save.call_count, 1)
+
+        with open(self.state_file) as f:
+            self.assertEqual(len(json.load(f)["last_traceroute_time"]), 20)
+
+    def test_cleanup_flushes_pending_state(self):
+        self.manager.record_traceroute_success("!deadbeef")
+        self.manager.cleanup()
+        with open(self.state_file) as f:
+            self.assertIn("!deadbeef", json.load(f)["last_traceroute_time"])
+
+    def test_cleanup_fsyncs_state_already_flushed(self):
+        self.manager.record_traceroute_success("!deadbeef")
+        # Stand in for the flusher having already written the latest state
+        self.manager._save_state()
+        with patch.object(traceroute_manager.os, "fsync") as fsync:
+            self.manager.cleanup()
+        fsync.assert_called_once()
+
+    def test_cleanup_without_changes_skips_write(self):
+        self.manager.cleanup()
+        self.assertFalse(os.path.exists(self.state_file))
+
+
+class TestRetryScheduling(unittest.TestCase):
+    def setUp(self):
+        fd, self.state_file = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        self.manager = TracerouteManager(
+            interface=MagicMock(),
+            node_cache=MagicMock(),
+            traceroute_persistence_file=self.state_file,
+        )
+        # Keep the worker from consuming the queue under test
+        self.manager._shutdown_flag.set()
+        self.manager._traceroute_worker_thread.join()
+
+    def tearDown(self):
+        self.manager.cleanup()
+        if os.path.exists(self.state_file):
+            os.unlink(self.state_file)
+
+    def test_retry_released_only_when_due(self):
+        self.manager._schedule_retry("!00000001", 1, ready_at=200.0)
+        self.manager._schedule_retry("!00000002", 0, ready_at=100.0)
+        # A node already scheduled is not scheduled twice
+        self.manager._schedule_retry("!00000001", 2, ready_at=50.0)
+
+        self.manager._release_due_retries(now=99.0)
+        self.assertTrue(self.manager._traceroute_queue.empty())
+
+        self.manager._release_due_retries(now=150.0)
+        self.assertEqual(self.manager._traceroute_queue.get_batch(), [("!00000002", 0)])
+
+        self.manager._release_due_retries(now=250.0)
+        self.assertEqual(self.manager._traceroute_queue.get_batch(), [("!00000001", 1)])
+
+
+if __name__ == "__main__":
+    unittest.main()